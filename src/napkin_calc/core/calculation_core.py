@@ -0,0 +1,426 @@
+"""Qt-free calculation model behind ``CalculationEngine``.
+
+``CalculationCore`` holds all of the engine's state and arithmetic but
+has no dependency on PySide6, so headless callers (tests, scripts) can
+do conversions without importing Qt.  Instead of emitting signals it
+reports changes by name through the ``_emit`` hook, which the Qt
+subclass in ``engine.py`` maps onto real signals.
+
+Design invariant: the core always stores *exact* values.  The
+``CalculationMode`` passed to accessor helpers only affects how the
+result is converted for display.
+
+Lock behaviour
+--------------
+``Volume = Rate * Payload``
+
+On startup no variable is locked (LockedVariable.NONE).  The first
+variable the user types into auto-locks -- this is reflected in the
+UI padlock buttons.  After that, the locked variable is held constant
+and the third is recalculated whenever either of the other two change.
+The user can override the lock at any time by clicking a different padlock.
+Reset clears the lock back to NONE.
+"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from decimal import Decimal
+
+from napkin_calc.core.constants import (
+    CalculationMode,
+    DataSizeUnit,
+    LockedVariable,
+    TimeUnit,
+    bytes_per_unit,
+    seconds_per_unit,
+)
+from napkin_calc.core.data_converter import DataSizeConverter
+from napkin_calc.core.time_converter import TimeUnitConverter
+
+_ZERO = Decimal("0")
+
+# (time_unit, size_unit, mode) -> (seconds per time unit, bytes per size unit).
+# One lookup per throughput grid cell.  The pair is kept rather than its
+# ratio: binary byte factors make seconds / bytes round at 28 digits, and
+# dividing last keeps results identical to ``bytes_per_period / divisor``.
+_SECONDS_AND_BYTES: dict[
+    tuple[TimeUnit, DataSizeUnit, CalculationMode], tuple[Decimal, Decimal]
+] = {
+    (time_unit, size_unit, mode): (
+        seconds_per_unit(time_unit, mode),
+        bytes_per_unit(size_unit, mode),
+    )
+    for time_unit in TimeUnit
+    for size_unit in DataSizeUnit
+    for mode in CalculationMode
+}
+
+
+class CalculationCore:
+    """Pure-Python calculation model for the Napkin Calculator.
+
+    Change notifications use the names of ``CalculationEngine``'s
+    signals: ``rates_changed``, ``storage_changed``, ``mode_changed``,
+    ``lock_changed`` and ``reset_occurred``.
+    """
+
+    def __init__(self) -> None:
+        self._time_converter = TimeUnitConverter()
+        # Scratch converter reused for best-unit display lookups
+        self._size_converter = DataSizeConverter()
+        self._display_mode = CalculationMode.EXACT
+        self._payload_size_bytes = _ZERO
+        self._locked = LockedVariable.NONE
+
+        # Stored target throughput in bytes/sec (exact).
+        # Used when Volume is an independent input rather than derived.
+        self._target_volume_bps = _ZERO
+
+        # Memoized ``data_throughput_bytes_per_second`` as
+        # (events/sec, payload, target, result).  Decimals are immutable and
+        # every mutation stores a new object, so identity is a valid key.
+        self._throughput_cache: tuple[Decimal, Decimal, Decimal, Decimal] | None = None
+
+        # Names of signals queued by the current mutation, in first-queued
+        # order.  Flushed when the outermost ``_batched`` block exits so each
+        # fires at most once and only after the model is fully consistent.
+        self._pending_signals: list[str] = []
+        self._batch_depth = 0
+
+    # -- display mode -------------------------------------------------------
+
+    @property
+    def display_mode(self) -> CalculationMode:
+        return self._display_mode
+
+    def set_display_mode(self, mode: CalculationMode) -> None:
+        if mode is not self._display_mode:
+            with self._batched():
+                self._display_mode = mode
+                self._queue("mode_changed")
+
+    def toggle_display_mode(self) -> None:
+        new_mode = (
+            CalculationMode.EXACT
+            if self._display_mode is CalculationMode.ESTIMATE
+            else CalculationMode.ESTIMATE
+        )
+        self.set_display_mode(new_mode)
+
+    # -- lock ---------------------------------------------------------------
+
+    @property
+    def locked_variable(self) -> LockedVariable:
+        return self._locked
+
+    def set_locked_variable(self, var: LockedVariable) -> None:
+        """Set the locked variable explicitly (user clicked a padlock)."""
+        if var is not self._locked:
+            with self._batched():
+                self._locked = var
+                self._queue("lock_changed")
+
+    def _auto_lock(self, var: LockedVariable) -> None:
+        """Auto-lock *var* if nothing is locked yet."""
+        if self._locked is LockedVariable.NONE:
+            self._locked = var
+            self._queue("lock_changed")
+
+    def _is_noop_edit(self, new: Decimal, current: Decimal) -> bool:
+        """True when replacing *current* with *new* would change nothing.
+
+        Without a stored target there is nothing to solve, and a non-zero
+        value can only auto-lock while nothing is locked yet.
+        """
+        return (
+            new == current
+            and not self._target_volume_bps
+            and (not new or self._locked is not LockedVariable.NONE)
+        )
+
+    # -- signal batching ----------------------------------------------------
+
+    @contextmanager
+    def batch_update(self) -> Iterator[None]:
+        """Apply several mutations as a single change.
+
+        Change notifications are held until the block exits and then
+        emitted once each, so listeners never see a half-applied state
+        (e.g. a loaded scenario's new rate with the old payload).
+        """
+        with self._batched():
+            yield
+
+    @contextmanager
+    def _batched(self) -> Iterator[None]:
+        """Group mutations so their queued signals are emitted once at the end.
+
+        Blocks may nest (e.g. a mutator calling another mutator); only the
+        outermost one flushes the queue.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self._emit_batch()
+
+    def _queue(self, signal_name: str) -> None:
+        """Schedule *signal_name* to be emitted when the current batch ends."""
+        if signal_name not in self._pending_signals:
+            self._pending_signals.append(signal_name)
+
+    def _emit_batch(self) -> None:
+        """Emit every queued signal exactly once, then clear the queue."""
+        pending = self._pending_signals
+        self._pending_signals = []
+        for signal_name in pending:
+            self._emit(signal_name)
+
+    def _emit(self, signal_name: str) -> None:
+        """Report that *signal_name* changed.  No-op without a UI layer."""
+
+    # -- traffic rate -------------------------------------------------------
+
+    def set_rate(self, value: Decimal, unit: TimeUnit) -> None:
+        """User edited the traffic rate.
+
+        Auto-locks Rate on first non-zero input if nothing is locked yet.
+        Resolves payload from the stored target when appropriate:
+        - Volume is locked and target is set, OR
+        - Payload is still zero and a stored target can now be resolved.
+        """
+        new_eps = value / seconds_per_unit(unit, CalculationMode.EXACT)
+        if self._is_noop_edit(new_eps, self._time_converter.events_per_second):
+            return
+        with self._batched():
+            self._time_converter.events_per_second = new_eps
+            if value:
+                self._auto_lock(LockedVariable.RATE)
+
+            should_solve_payload = (
+                bool(self._target_volume_bps)
+                and bool(self._time_converter.events_per_second)
+                and (
+                    self._locked is LockedVariable.VOLUME
+                    or not self._payload_size_bytes
+                )
+            )
+            if should_solve_payload:
+                self._payload_size_bytes = (
+                    self._target_volume_bps / self._time_converter.events_per_second
+                )
+
+            self._queue("rates_changed")
+            self._queue("storage_changed")
+
+    def get_rate(self, unit: TimeUnit) -> Decimal:
+        return self._time_converter.get_rate(unit, self._display_mode)
+
+    def get_rate_exact(self, unit: TimeUnit) -> Decimal:
+        return self._time_converter.get_rate(unit, CalculationMode.EXACT)
+
+    @property
+    def events_per_second_exact(self) -> Decimal:
+        return self._time_converter.events_per_second
+
+    # -- payload size -------------------------------------------------------
+
+    @property
+    def payload_size_bytes(self) -> Decimal:
+        return self._payload_size_bytes
+
+    def set_payload_size(self, value: Decimal, unit: DataSizeUnit) -> None:
+        """User edited the payload size.
+
+        Auto-locks Payload on first non-zero input if nothing is locked yet.
+        Resolves rate from the stored target when appropriate:
+        - Volume is locked and target is set, OR
+        - Rate is still zero and a stored target can now be resolved.
+        """
+        new_bytes = value * bytes_per_unit(unit, CalculationMode.EXACT)
+        if self._is_noop_edit(new_bytes, self._payload_size_bytes):
+            return
+        with self._batched():
+            self._payload_size_bytes = new_bytes
+            if self._payload_size_bytes:
+                self._auto_lock(LockedVariable.PAYLOAD)
+
+            should_solve_rate = (
+                bool(self._target_volume_bps)
+                and bool(self._payload_size_bytes)
+                and (
+                    self._locked is LockedVariable.VOLUME
+                    or not self._time_converter.events_per_second
+                )
+            )
+            if should_solve_rate:
+                self._time_converter.events_per_second = (
+                    self._target_volume_bps / self._payload_size_bytes
+                )
+                self._queue("rates_changed")
+
+            self._queue("storage_changed")
+
+    def get_payload_size(self, unit: DataSizeUnit) -> Decimal:
+        divisor = bytes_per_unit(unit, self._display_mode)
+        if divisor.is_zero():
+            return _ZERO
+        return self._payload_size_bytes / divisor
+
+    # -- data throughput / storage ------------------------------------------
+
+    @property
+    def data_throughput_bytes_per_second(self) -> Decimal:
+        """Bytes of data generated per second.
+
+        If a target volume is set and the computed value is still zero
+        (because rate or payload is missing), returns the target so the
+        throughput grid shows useful data.
+
+        The result is cached until one of its inputs changes, since the
+        grids read it once per time unit on every refresh.
+        """
+        events_per_second = self._time_converter.events_per_second
+        payload = self._payload_size_bytes
+        target = self._target_volume_bps
+        cache = self._throughput_cache
+        if (
+            cache is not None
+            and cache[0] is events_per_second
+            and cache[1] is payload
+            and cache[2] is target
+        ):
+            return cache[3]
+
+        computed = events_per_second * payload
+        if not computed and target:
+            computed = target
+        self._throughput_cache = (events_per_second, payload, target, computed)
+        return computed
+
+    def get_data_throughput_bytes(self, time_unit: TimeUnit) -> Decimal:
+        throughput = self.data_throughput_bytes_per_second
+        if not throughput:
+            return _ZERO
+        return throughput * seconds_per_unit(time_unit, self._display_mode)
+
+    def get_data_throughput(
+        self, time_unit: TimeUnit, size_unit: DataSizeUnit
+    ) -> Decimal:
+        throughput = self.data_throughput_bytes_per_second
+        if not throughput:
+            return _ZERO
+        seconds, size = _SECONDS_AND_BYTES[(time_unit, size_unit, self._display_mode)]
+        return throughput * seconds / size
+
+    def get_data_throughput_best_unit(
+        self, time_unit: TimeUnit
+    ) -> tuple[Decimal, DataSizeUnit]:
+        total_bytes = self.get_data_throughput_bytes(time_unit)
+        converter = self._size_converter
+        converter.size_in_bytes = total_bytes
+        best = converter.best_unit(self._display_mode)
+        return converter.get_size(best, self._display_mode), best
+
+    def get_all_throughputs(
+        self,
+    ) -> dict[TimeUnit, tuple[Decimal, Decimal, DataSizeUnit]]:
+        """Return ``(bytes, value in best unit, best unit)`` per time unit.
+
+        One call for a whole throughput grid: the bytes/sec product is read
+        once and each row needs only a multiply plus the best-unit lookup.
+        """
+        mode = self._display_mode
+        throughput = self.data_throughput_bytes_per_second
+        converter = self._size_converter
+        rows: dict[TimeUnit, tuple[Decimal, Decimal, DataSizeUnit]] = {}
+        for time_unit in TimeUnit:
+            total_bytes = throughput * seconds_per_unit(time_unit, mode)
+            converter.size_in_bytes = total_bytes
+            best = converter.best_unit(mode)
+            rows[time_unit] = (total_bytes, converter.get_size(best, mode), best)
+        return rows
+
+    def set_target_throughput(
+        self, value: Decimal, size_unit: DataSizeUnit, time_unit: TimeUnit
+    ) -> None:
+        """User edited the target total volume.
+
+        If Rate is locked, recalculate Payload.
+        If Payload is locked, recalculate Rate.
+        If Volume is locked (user overrides), just store and update naturally.
+
+        If neither Rate nor Payload is available yet, the target is stored
+        as a pending constraint for later resolution.
+        """
+        with self._batched():
+            target_bytes = value * bytes_per_unit(size_unit, CalculationMode.EXACT)
+            target_bps = target_bytes / seconds_per_unit(time_unit, CalculationMode.EXACT)
+            self._target_volume_bps = target_bps
+            if target_bps:
+                self._auto_lock(LockedVariable.VOLUME)
+
+            has_rate = bool(self.events_per_second_exact)
+            has_payload = bool(self._payload_size_bytes)
+
+            if self._locked is LockedVariable.RATE and has_rate:
+                self._payload_size_bytes = target_bps / self.events_per_second_exact
+                self._queue("storage_changed")
+            elif self._locked is LockedVariable.PAYLOAD and has_payload:
+                self._time_converter.events_per_second = (
+                    target_bps / self._payload_size_bytes
+                )
+                self._queue("rates_changed")
+                self._queue("storage_changed")
+            elif self._locked is LockedVariable.VOLUME:
+                # User is overriding the locked volume -- just store and recompute
+                self._queue("storage_changed")
+            elif has_rate:
+                # Default: hold rate, solve payload
+                self._payload_size_bytes = target_bps / self.events_per_second_exact
+                self._queue("storage_changed")
+            elif has_payload:
+                # Hold payload, solve rate
+                self._time_converter.events_per_second = (
+                    target_bps / self._payload_size_bytes
+                )
+                self._queue("rates_changed")
+                self._queue("storage_changed")
+            else:
+                # Neither known -- store as pending, throughput grid will show it
+                self._queue("storage_changed")
+
+    # -- pending target (for backward compat with existing tests) -----------
+
+    @property
+    def pending_target_bytes_per_second(self) -> Decimal:
+        """The stored target throughput (may or may not be fully resolved)."""
+        return self._target_volume_bps
+
+    # -- reset --------------------------------------------------------------
+
+    def reset(self) -> None:
+        """Clear all state back to zero and remove any lock.
+
+        Only the parts that actually change are announced, so resetting
+        an already-clean model emits just ``reset_occurred`` (which the
+        DBP panel still needs to clear its own, engine-independent fields).
+        """
+        with self._batched():
+            if (
+                self._time_converter.events_per_second
+                or self._payload_size_bytes
+                or self._target_volume_bps
+            ):
+                self._time_converter.reset()
+                self._payload_size_bytes = _ZERO
+                self._target_volume_bps = _ZERO
+                self._throughput_cache = None
+                self._queue("rates_changed")
+                self._queue("storage_changed")
+            if self._locked is not LockedVariable.NONE:
+                self._locked = LockedVariable.NONE
+                self._queue("lock_changed")
+            self._queue("reset_occurred")
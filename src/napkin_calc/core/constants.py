@@ -7,9 +7,34 @@ Two sets of factors are maintained:
 
 from decimal import Decimal
 from enum import Enum
+from functools import cache
 
 
-class TimeUnit(Enum):
+class _FastEnum(Enum):
+    """Enum whose members hash by identity.
+
+    ``Enum.__hash__`` is a Python-level ``hash(self._name_)``; members are
+    singletons, so the C-level ``object.__hash__`` is equivalent and makes
+    the unit-keyed lookups on the hot path noticeably cheaper.
+    """
+    __hash__ = object.__hash__
+
+
+class _IndexedEnum(_FastEnum):
+    """Fast enum whose members also carry a contiguous ``_index`` (0..n-1).
+
+    Lets small factor tables be plain tuples indexed by position rather
+    than dicts keyed by member.
+    """
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        # Enum calls this once the members exist, in definition order
+        super().__init_subclass__(**kwargs)
+        for index, member in enumerate(cls):
+            member._index = index
+
+
+class TimeUnit(_IndexedEnum):
     """Supported time windows for rate conversion."""
     SECOND = "Second"
     MINUTE = "Minute"
@@ -30,7 +55,7 @@ TIME_UNIT_ABBREVIATIONS: dict[TimeUnit, str] = {
 }
 
 
-class DataSizeUnit(Enum):
+class DataSizeUnit(_IndexedEnum):
     """Supported data-size magnitudes."""
     BYTE = "B"
     KILOBYTE = "KB"
@@ -41,7 +66,7 @@ class DataSizeUnit(Enum):
     EXABYTE = "EB"
 
 
-class BandwidthUnit(Enum):
+class BandwidthUnit(_IndexedEnum):
     """Supported network bandwidth magnitudes (bits/sec)."""
     BPS = "bps"
     KBPS = "Kbps"
@@ -50,7 +75,7 @@ class BandwidthUnit(Enum):
     TBPS = "Tbps"
 
 
-class LockedVariable(Enum):
+class LockedVariable(_FastEnum):
     """Which variable is held constant when the other two change.
 
     NONE means nothing is locked yet; the first variable the user edits
@@ -62,12 +87,19 @@ class LockedVariable(Enum):
     VOLUME = "volume"
 
 
-class CalculationMode(Enum):
+class CalculationMode(_FastEnum):
     """Controls how values are *displayed* (engine always stores exact)."""
     EXACT = "exact"
     ESTIMATE = "estimate"
 
 
+def _by_index(table: dict) -> tuple[Decimal, ...]:
+    """Return *table*'s factors as a tuple ordered by each unit's ``_index``."""
+    return tuple(
+        factor for _, factor in sorted(table.items(), key=lambda item: item[0]._index)
+    )
+
+
 # ---------------------------------------------------------------------------
 # Time – seconds per unit
 # ---------------------------------------------------------------------------
@@ -85,26 +117,30 @@ SECONDS_PER_MONTH_ESTIMATE = Decimal("2592000")  # 30 * 86400
 SECONDS_PER_YEAR_ESTIMATE = Decimal("31536000")   # 365 * 86400
 
 
+_SECONDS_EXACT: tuple[Decimal, ...] = _by_index({
+    TimeUnit.SECOND: Decimal("1"),
+    TimeUnit.MINUTE: SECONDS_PER_MINUTE,
+    TimeUnit.HOUR: SECONDS_PER_HOUR,
+    TimeUnit.DAY: SECONDS_PER_DAY,
+    TimeUnit.MONTH: SECONDS_PER_MONTH_EXACT,
+    TimeUnit.YEAR: SECONDS_PER_YEAR_EXACT,
+})
+
+_SECONDS_ESTIMATE: tuple[Decimal, ...] = _by_index({
+    TimeUnit.SECOND: Decimal("1"),
+    TimeUnit.MINUTE: SECONDS_PER_MINUTE,
+    TimeUnit.HOUR: SECONDS_PER_HOUR,
+    TimeUnit.DAY: SECONDS_PER_DAY,
+    TimeUnit.MONTH: SECONDS_PER_MONTH_ESTIMATE,
+    TimeUnit.YEAR: SECONDS_PER_YEAR_ESTIMATE,
+})
+
+
+@cache
 def seconds_per_unit(unit: TimeUnit, mode: CalculationMode) -> Decimal:
     """Return the number of seconds in one *unit* for the given mode."""
-    exact_map = {
-        TimeUnit.SECOND: Decimal("1"),
-        TimeUnit.MINUTE: SECONDS_PER_MINUTE,
-        TimeUnit.HOUR: SECONDS_PER_HOUR,
-        TimeUnit.DAY: SECONDS_PER_DAY,
-        TimeUnit.MONTH: SECONDS_PER_MONTH_EXACT,
-        TimeUnit.YEAR: SECONDS_PER_YEAR_EXACT,
-    }
-    estimate_map = {
-        TimeUnit.SECOND: Decimal("1"),
-        TimeUnit.MINUTE: SECONDS_PER_MINUTE,
-        TimeUnit.HOUR: SECONDS_PER_HOUR,
-        TimeUnit.DAY: SECONDS_PER_DAY,
-        TimeUnit.MONTH: SECONDS_PER_MONTH_ESTIMATE,
-        TimeUnit.YEAR: SECONDS_PER_YEAR_ESTIMATE,
-    }
-    mapping = exact_map if mode == CalculationMode.EXACT else estimate_map
-    return mapping[unit]
+    table = _SECONDS_EXACT if mode is CalculationMode.EXACT else _SECONDS_ESTIMATE
+    return table[unit._index]
 
 
 # ---------------------------------------------------------------------------
@@ -126,51 +162,63 @@ BYTES_PER_PB_ESTIMATE = Decimal("1000000000000000")
 BYTES_PER_EB_ESTIMATE = Decimal("1000000000000000000")
 
 
+_BYTES_EXACT: tuple[Decimal, ...] = _by_index({
+    DataSizeUnit.BYTE: Decimal("1"),
+    DataSizeUnit.KILOBYTE: BYTES_PER_KB_EXACT,
+    DataSizeUnit.MEGABYTE: BYTES_PER_MB_EXACT,
+    DataSizeUnit.GIGABYTE: BYTES_PER_GB_EXACT,
+    DataSizeUnit.TERABYTE: BYTES_PER_TB_EXACT,
+    DataSizeUnit.PETABYTE: BYTES_PER_PB_EXACT,
+    DataSizeUnit.EXABYTE: BYTES_PER_EB_EXACT,
+})
+
+_BYTES_ESTIMATE: tuple[Decimal, ...] = _by_index({
+    DataSizeUnit.BYTE: Decimal("1"),
+    DataSizeUnit.KILOBYTE: BYTES_PER_KB_ESTIMATE,
+    DataSizeUnit.MEGABYTE: BYTES_PER_MB_ESTIMATE,
+    DataSizeUnit.GIGABYTE: BYTES_PER_GB_ESTIMATE,
+    DataSizeUnit.TERABYTE: BYTES_PER_TB_ESTIMATE,
+    DataSizeUnit.PETABYTE: BYTES_PER_PB_ESTIMATE,
+    DataSizeUnit.EXABYTE: BYTES_PER_EB_ESTIMATE,
+})
+
+
+@cache
 def bytes_per_unit(unit: DataSizeUnit, mode: CalculationMode) -> Decimal:
     """Return the number of bytes in one *unit* for the given mode."""
-    exact_map = {
-        DataSizeUnit.BYTE: Decimal("1"),
-        DataSizeUnit.KILOBYTE: BYTES_PER_KB_EXACT,
-        DataSizeUnit.MEGABYTE: BYTES_PER_MB_EXACT,
-        DataSizeUnit.GIGABYTE: BYTES_PER_GB_EXACT,
-        DataSizeUnit.TERABYTE: BYTES_PER_TB_EXACT,
-        DataSizeUnit.PETABYTE: BYTES_PER_PB_EXACT,
-        DataSizeUnit.EXABYTE: BYTES_PER_EB_EXACT,
-    }
-    estimate_map = {
-        DataSizeUnit.BYTE: Decimal("1"),
-        DataSizeUnit.KILOBYTE: BYTES_PER_KB_ESTIMATE,
-        DataSizeUnit.MEGABYTE: BYTES_PER_MB_ESTIMATE,
-        DataSizeUnit.GIGABYTE: BYTES_PER_GB_ESTIMATE,
-        DataSizeUnit.TERABYTE: BYTES_PER_TB_ESTIMATE,
-        DataSizeUnit.PETABYTE: BYTES_PER_PB_ESTIMATE,
-        DataSizeUnit.EXABYTE: BYTES_PER_EB_ESTIMATE,
-    }
-    mapping = exact_map if mode == CalculationMode.EXACT else estimate_map
-    return mapping[unit]
+    table = _BYTES_EXACT if mode is CalculationMode.EXACT else _BYTES_ESTIMATE
+    return table[unit._index]
+
+
+# ---------------------------------------------------------------------------
+# Bandwidth – bits per unit
+# ---------------------------------------------------------------------------
 
+# Network bandwidth is quoted in SI units (1 Gbps = 10^9 bits/sec), so the
+# same base-10 factors apply in both modes.
+BITS_PER_KBPS = Decimal("1000")
+BITS_PER_MBPS = Decimal("1000000")
+BITS_PER_GBPS = Decimal("1000000000")
+BITS_PER_TBPS = Decimal("1000000000000")
 
+
+_BITS: tuple[Decimal, ...] = _by_index({
+    BandwidthUnit.BPS: Decimal("1"),
+    BandwidthUnit.KBPS: BITS_PER_KBPS,
+    BandwidthUnit.MBPS: BITS_PER_MBPS,
+    BandwidthUnit.GBPS: BITS_PER_GBPS,
+    BandwidthUnit.TBPS: BITS_PER_TBPS,
+})
+
+
+@cache
 def bits_per_bandwidth_unit(unit: BandwidthUnit, mode: CalculationMode) -> Decimal:
-    """Return the number of bits in one *unit* for the given mode."""
-    # Bandwidth is usually base-10 even in exact mode, but some people use base-2.
-    # For napkin math, base-10 (1000) is standard for bits/sec (e.g. 1 Gbps = 10^9 bps).
-    exact_map = {
-        BandwidthUnit.BPS: Decimal("1"),
-        BandwidthUnit.KBPS: BYTES_PER_KB_EXACT,
-        BandwidthUnit.MBPS: BYTES_PER_MB_EXACT,
-        BandwidthUnit.GBPS: BYTES_PER_GB_EXACT,
-        BandwidthUnit.TBPS: BYTES_PER_TB_EXACT,
-    }
-    estimate_map = {
-        BandwidthUnit.BPS: Decimal("1"),
-        BandwidthUnit.KBPS: BYTES_PER_KB_ESTIMATE,
-        BandwidthUnit.MBPS: BYTES_PER_MB_ESTIMATE,
-        BandwidthUnit.GBPS: BYTES_PER_GB_ESTIMATE,
-        BandwidthUnit.TBPS: BYTES_PER_TB_ESTIMATE,
-    }
-    # Often telecom uses estimate map (base 10) for both, but we'll follow mode to be consistent.
-    mapping = exact_map if mode == CalculationMode.EXACT else estimate_map
-    return mapping[unit]
+    """Return the number of bits in one *unit*.
+
+    Bandwidth is always base-10; *mode* is accepted for symmetry with the
+    other factor helpers and does not change the result.
+    """
+    return _BITS[unit._index]
 
 
 # ---------------------------------------------------------------------------
@@ -14,6 +14,21 @@ from napkin_calc.core.constants import (
     bytes_per_unit,
 )
 
+_ZERO = Decimal("0")
+
+# Per-mode (bytes-per-unit, unit) pairs, largest first.  ``best_unit``
+# walks this ladder with plain comparisons instead of dividing.
+_BEST_UNIT_LADDER: dict[CalculationMode, tuple[tuple[Decimal, DataSizeUnit], ...]] = {
+    mode: tuple(
+        sorted(
+            ((bytes_per_unit(unit, mode), unit) for unit in DataSizeUnit),
+            key=lambda entry: entry[0],
+            reverse=True,
+        )
+    )
+    for mode in CalculationMode
+}
+
 
 class DataSizeConverter:
     """Bidirectional converter across all supported data-size units.
@@ -22,14 +37,21 @@ class DataSizeConverter:
     conversion factors.
     """
 
+    __slots__ = ("_bytes", "_all_sizes_cache")
+
     def __init__(self) -> None:
-        self._bytes: Decimal = Decimal("0")
+        self._bytes: Decimal = _ZERO
+        # mode -> sizes for the current value; cleared on every mutation
+        self._all_sizes_cache: dict[
+            CalculationMode, Dict[DataSizeUnit, Decimal]
+        ] = {}
 
     # -- mutators -----------------------------------------------------------
 
     def set_size(self, value: Decimal, unit: DataSizeUnit) -> None:
         """Set the size from a value expressed in *unit* (always exact)."""
         self._bytes = value * bytes_per_unit(unit, CalculationMode.EXACT)
+        self._all_sizes_cache.clear()
 
     @property
     def size_in_bytes(self) -> Decimal:
@@ -39,6 +61,7 @@ class DataSizeConverter:
     @size_in_bytes.setter
     def size_in_bytes(self, value: Decimal) -> None:
         self._bytes = value
+        self._all_sizes_cache.clear()
 
     # -- accessors ----------------------------------------------------------
 
@@ -49,8 +72,16 @@ class DataSizeConverter:
     def get_all_sizes(
         self, mode: CalculationMode
     ) -> Dict[DataSizeUnit, Decimal]:
-        """Return sizes for every data-size unit in the given display mode."""
-        return {unit: self.get_size(unit, mode) for unit in DataSizeUnit}
+        """Return sizes for every data-size unit in the given display mode.
+
+        Results are memoized per mode until the size changes, so repeated
+        refreshes without an intervening edit skip the divisions.
+        """
+        sizes = self._all_sizes_cache.get(mode)
+        if sizes is None:
+            sizes = {unit: self.get_size(unit, mode) for unit in DataSizeUnit}
+            self._all_sizes_cache[mode] = sizes
+        return dict(sizes)
 
     def best_unit(self, mode: CalculationMode) -> DataSizeUnit:
         """Return the largest unit where the value is still >= 1.
@@ -58,12 +89,13 @@ class DataSizeConverter:
         Useful for picking a human-friendly display unit automatically.
         Falls back to BYTE if the value is very small.
         """
-        # Walk from largest to smallest
-        for unit in reversed(list(DataSizeUnit)):
-            if self.get_size(unit, mode) >= 1:
+        # Walk from largest to smallest: size >= 1 <=> bytes >= factor
+        for threshold, unit in _BEST_UNIT_LADDER[mode]:
+            if self._bytes >= threshold:
                 return unit
         return DataSizeUnit.BYTE
 
     def reset(self) -> None:
         """Clear the stored size to zero."""
-        self._bytes = Decimal("0")
+        self._bytes = _ZERO
+        self._all_sizes_cache.clear()
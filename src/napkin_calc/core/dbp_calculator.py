@@ -4,16 +4,22 @@ from decimal import Decimal
 
 from napkin_calc.core.constants import BandwidthUnit, CalculationMode, bits_per_bandwidth_unit
 
+_ZERO = Decimal("0")
+# ms-per-second * bits-per-byte: turns bits/sec * ms into bytes in one divide.
+_BIT_MS_PER_BYTE_SECOND = Decimal("8000")
+
 
 class DBPCalculator:
     """Calculate the Delay-Bandwidth Product (data in flight)."""
 
+    __slots__ = ("_bandwidth_bits_per_sec", "_rtt_ms")
+
     def __init__(self) -> None:
-        self._bandwidth_bits_per_sec = Decimal("0")
-        self._rtt_ms = Decimal("0")
+        self._bandwidth_bits_per_sec = _ZERO
+        self._rtt_ms = _ZERO
 
     def set_bandwidth(self, value: Decimal, unit: BandwidthUnit, mode: CalculationMode) -> None:
-        """Set the bandwidth in the given unit (mode dictates base 10 or base 2)."""
+        """Set the bandwidth in the given unit (always base 10)."""
         self._bandwidth_bits_per_sec = value * bits_per_bandwidth_unit(unit, mode)
 
     def set_rtt(self, rtt_ms: Decimal) -> None:
@@ -23,7 +29,5 @@ class DBPCalculator:
     @property
     def data_in_flight_bytes(self) -> Decimal:
         """Data in flight (DBP) in bytes."""
-        # DBP bits = bandwidth (bits/sec) * rtt (sec)
-        rtt_sec = self._rtt_ms / Decimal("1000")
-        dbp_bits = self._bandwidth_bits_per_sec * rtt_sec
-        return dbp_bits / Decimal("8")
+        # DBP bytes = bandwidth (bits/sec) * rtt (ms) / 1000 (ms/sec) / 8 (bits/byte)
+        return self._bandwidth_bits_per_sec * self._rtt_ms / _BIT_MS_PER_BYTE_SECOND
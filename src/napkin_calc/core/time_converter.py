@@ -14,6 +14,12 @@ from napkin_calc.core.constants import (
     seconds_per_unit,
 )
 
+# Iterating an Enum class goes through EnumType.__iter__ each time; a
+# tuple built once is several times cheaper to loop over.
+_ALL_UNITS: tuple[TimeUnit, ...] = tuple(TimeUnit)
+
+_ZERO = Decimal("0")
+
 
 class TimeUnitConverter:
     """Bidirectional rate converter across all supported time units.
@@ -23,8 +29,14 @@ class TimeUnitConverter:
     requested in either exact or estimate mode.
     """
 
+    __slots__ = ("_events_per_second", "_all_rates_cache")
+
     def __init__(self) -> None:
-        self._events_per_second: Decimal = Decimal("0")
+        self._events_per_second: Decimal = _ZERO
+        # mode -> (events/sec the rates were computed from, rates)
+        self._all_rates_cache: dict[
+            CalculationMode, tuple[Decimal, Dict[TimeUnit, Decimal]]
+        ] = {}
 
     # -- mutators -----------------------------------------------------------
 
@@ -36,6 +48,7 @@ class TimeUnitConverter:
         """
         seconds = seconds_per_unit(unit, CalculationMode.EXACT)
         self._events_per_second = value / seconds
+        self._all_rates_cache.clear()
 
     # -- accessors ----------------------------------------------------------
 
@@ -44,6 +57,12 @@ class TimeUnitConverter:
         """Canonical rate stored internally (always exact)."""
         return self._events_per_second
 
+    @events_per_second.setter
+    def events_per_second(self, value: Decimal) -> None:
+        """Set the canonical rate directly, skipping the unit conversion."""
+        self._events_per_second = value
+        self._all_rates_cache.clear()
+
     def get_rate(self, unit: TimeUnit, mode: CalculationMode) -> Decimal:
         """Return the rate expressed in *unit* for the given display mode."""
         seconds = seconds_per_unit(unit, mode)
@@ -52,9 +71,24 @@ class TimeUnitConverter:
     def get_all_rates(
         self, mode: CalculationMode
     ) -> Dict[TimeUnit, Decimal]:
-        """Return rates for every time unit in the given display mode."""
-        return {unit: self.get_rate(unit, mode) for unit in TimeUnit}
+        """Return rates for every time unit in the given display mode.
+
+        Results are memoized per mode until the rate changes, so repeated
+        refreshes without an intervening edit skip the multiplications.
+        """
+        entry = self._all_rates_cache.get(mode)
+        if entry is not None and entry[0] is self._events_per_second:
+            return dict(entry[1])
+        # Same arithmetic as get_rate, inlined to skip a method call per unit
+        events_per_second = self._events_per_second
+        rates = {
+            unit: events_per_second * seconds_per_unit(unit, mode)
+            for unit in _ALL_UNITS
+        }
+        self._all_rates_cache[mode] = (self._events_per_second, rates)
+        return dict(rates)
 
     def reset(self) -> None:
         """Clear the stored rate to zero."""
-        self._events_per_second = Decimal("0")
+        self._events_per_second = _ZERO
+        self._all_rates_cache.clear()
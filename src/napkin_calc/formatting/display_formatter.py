@@ -6,8 +6,8 @@ Responsibilities:
 - Rounding controls for estimate mode.
 """
 
-import math
 from decimal import Decimal, ROUND_HALF_UP
+from functools import lru_cache
 
 
 # Threshold above which we append scientific notation
@@ -18,51 +18,79 @@ _SCIENTIFIC_NOTATION_THRESHOLD = Decimal("1000")
 _WHOLE_NUMBER_THRESHOLD = Decimal("100")
 _SMALL_VALUE_DECIMALS = 2
 
+# quantize() exponents, built once: _QUANTIZERS[n] has n fractional digits.
+_QUANTIZERS = tuple(Decimal(1).scaleb(-n) for n in range(10))
 
-class DisplayFormatter:
-    """Stateless formatter – call ``format_value`` on any Decimal."""
 
-    @staticmethod
-    def format_value(value: Decimal) -> str:
-        """Return a human-readable string with optional 10^x annotation.
+# The public formatters are memoized: panels re-format the same values on
+# every refresh.  Their output depends only on the numeric value (not its
+# exponent or the display mode), so equal Decimals can share a cache entry.
+
+@lru_cache(maxsize=1024)
+def format_value(value: Decimal) -> str:
+    """Return a human-readable string with optional 10^x annotation.
+
+    Rounding rule: values >= 100 are shown as whole numbers;
+    smaller values keep up to 2 decimal places.
+
+    Returns
+    -------
+    str
+        e.g. ``"1,000,000  (10^6)"`` or ``"0.12"``.
+    """
+    if value == 0:
+        return "0"
+
+    formatted = _format_rounded(value)
+    notation = _scientific_notation_suffix(value)
+
+    if notation:
+        return f"{formatted}  ({notation})"
+    return formatted
+
 
-        Rounding rule: values >= 100 are shown as whole numbers;
-        smaller values keep up to 2 decimal places.
+@lru_cache(maxsize=1024)
+def format_input(value: Decimal) -> str:
+    """Format a value for placing back into an input field (no 10^x)."""
+    if value == 0:
+        return "0"
+    return _format_rounded(value)
 
-        Returns
-        -------
-        str
-            e.g. ``"1,000,000  (10^6)"`` or ``"0.12"``.
-        """
-        if value == 0:
-            return "0"
 
-        rounded = _smart_round(value)
-        formatted = _add_thousands_separator(rounded)
-        notation = _scientific_notation_suffix(value)
+@lru_cache(maxsize=1024)
+def scientific_notation(value: Decimal) -> str:
+    """Return e.g. ``'10^6'`` for large values, or empty string."""
+    return _scientific_notation_suffix(value)
 
-        if notation:
-            return f"{formatted}  ({notation})"
-        return formatted
 
-    @staticmethod
-    def format_input(value: Decimal) -> str:
-        """Format a value for placing back into an input field (no 10^x)."""
-        if value == 0:
-            return "0"
-        rounded = _smart_round(value)
-        return _add_thousands_separator(rounded)
+class DisplayFormatter:
+    """Stateless formatter – namespace over the module-level functions.
+
+    Kept for existing callers; new code can call ``format_value`` and
+    friends directly and skip the attribute lookup.
+    """
 
-    @staticmethod
-    def scientific_notation(value: Decimal) -> str:
-        """Return e.g. ``'10^6'`` for large values, or empty string."""
-        return _scientific_notation_suffix(value)
+    format_value = staticmethod(format_value)
+    format_input = staticmethod(format_input)
+    scientific_notation = staticmethod(scientific_notation)
 
 
 # ---------------------------------------------------------------------------
 # Internal helpers
 # ---------------------------------------------------------------------------
 
+def _format_rounded(value: Decimal) -> str:
+    """Apply ``_smart_round`` and thousands separators to *value*.
+
+    Whole numbers are the common case in the grids, so they go straight
+    to integer formatting without any quantize/normalize work.
+    """
+    integral = value.to_integral_value()
+    if value == integral:
+        return f"{int(integral):,}"
+    return _add_thousands_separator(_smart_round(value))
+
+
 def _smart_round(value: Decimal) -> Decimal:
     """Round *value* based on its magnitude.
 
@@ -74,9 +102,9 @@ def _smart_round(value: Decimal) -> Decimal:
         return value.to_integral_value()
 
     if abs(value) >= _WHOLE_NUMBER_THRESHOLD:
-        return value.quantize(Decimal("1"), rounding=ROUND_HALF_UP)
+        return value.quantize(_QUANTIZERS[0], rounding=ROUND_HALF_UP)
 
-    rounded = value.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+    rounded = value.quantize(_QUANTIZERS[_SMALL_VALUE_DECIMALS], rounding=ROUND_HALF_UP)
     return rounded.normalize()
 
 
@@ -85,13 +113,13 @@ def _add_thousands_separator(value: Decimal) -> str:
 
     Works for both integer-like Decimals and those with fractional parts.
     """
-    if value == value.to_integral_value():
-        return f"{int(value):,}"
+    integral = value.to_integral_value()
+    if value == integral:
+        return f"{int(integral):,}"
 
-    sign, digits, exponent = value.as_tuple()
-    # Convert to string via float formatting to get commas
-    # (Decimal.__format__ supports commas from Python 3.1+)
-    return f"{value:,.{-exponent}f}"
+    # Decimal's "f" format without a precision keeps the value's own
+    # exponent, so no as_tuple() round-trip is needed.
+    return f"{value:,f}"
 
 
 def _scientific_notation_suffix(value: Decimal) -> str:
@@ -100,5 +128,6 @@ def _scientific_notation_suffix(value: Decimal) -> str:
     if abs_value < _SCIENTIFIC_NOTATION_THRESHOLD:
         return ""
 
-    exponent = int(math.log10(float(abs_value)))
-    return f"10^{exponent}"
+    # adjusted() is the exponent of the most significant digit, i.e.
+    # floor(log10(|value|)) without a lossy float round-trip.
+    return f"10^{abs_value.adjusted()}"
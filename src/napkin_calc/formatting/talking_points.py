@@ -9,6 +9,7 @@ like "~1.5 PB" or "~400 GB".
 """
 
 from decimal import Decimal, ROUND_HALF_UP
+from functools import lru_cache
 
 from napkin_calc.core.constants import DataSizeUnit
 
@@ -24,6 +25,14 @@ _MAGNITUDE_TIERS: list[tuple[Decimal, str]] = [
     (Decimal("1E3"),  "thousand"),
 ]
 
+# The same tiers smallest first: entry ``n - 1`` covers values whose
+# decimal exponent (``Decimal.adjusted()``) lies in [3n, 3n + 3).
+_TIERS_BY_EXPONENT_GROUP = tuple(reversed(_MAGNITUDE_TIERS))
+
+# quantize() exponents for whole numbers and one decimal place.
+_WHOLE = Decimal("1")
+_ONE_DECIMAL = Decimal("0.1")
+
 
 class TalkingPointGenerator:
     """Convert a numeric value into an interview-friendly phrase."""
@@ -49,21 +58,16 @@ class TalkingPointGenerator:
         if value == 0:
             return "0"
 
-        rounded = value.quantize(Decimal("0.1"), rounding=ROUND_HALF_UP)
-
-        if rounded == rounded.to_integral_value():
-            int_value = int(rounded)
-            if value == rounded:
-                return f"{int_value} {unit.value}"
-            return f"~{int_value} {unit.value}"
-
-        display = f"{rounded.normalize()}"
-        return f"~{display} {unit.value}"
+        return _round_to_tenths(value, unit.value)
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def generate(value: Decimal) -> str:
         """Return a rounded, speakable string for *value*.
 
+        Memoized: the rate rows re-phrase the same values on every
+        refresh, and the phrase depends only on the numeric value.
+
         Examples
         --------
         >>> TalkingPointGenerator.generate(Decimal("115"))
@@ -81,35 +85,36 @@ class TalkingPointGenerator:
         abs_value = abs(value)
         sign_prefix = "-" if value < 0 else ""
 
-        for threshold, label in _MAGNITUDE_TIERS:
-            if abs_value >= threshold:
-                scaled = abs_value / threshold
-                return sign_prefix + _format_scaled(scaled, label)
+        # Pick the tier from the exponent instead of comparing against
+        # each threshold in turn.
+        group = abs_value.adjusted() // 3
+        if group > 0:
+            threshold, label = _TIERS_BY_EXPONENT_GROUP[
+                min(group, len(_TIERS_BY_EXPONENT_GROUP)) - 1
+            ]
+            return sign_prefix + _round_to_tenths(abs_value / threshold, label)
 
         # Below 1,000 – just round sensibly
         rounded = _round_small(abs_value)
         return f"{sign_prefix}~{rounded}"
 
 
-def _format_scaled(scaled: Decimal, label: str) -> str:
-    """Format a value that has been divided by its magnitude tier.
+def _round_to_tenths(value: Decimal, label: str) -> str:
+    """Round *value* to one decimal place and append *label*.
 
-    If the scaled number is a clean integer (e.g. exactly 10 million)
-    we omit the "~" prefix.  Otherwise we round to one decimal and
-    prefix with "~".
+    Works on an integer count of tenths rather than quantize/normalize,
+    so the digits are formatted with plain int arithmetic.  "~" marks a
+    rounded result; a trailing ".0" is dropped.
     """
-    # Round to one decimal place for the spoken phrase
-    rounded = scaled.quantize(Decimal("0.1"), rounding=ROUND_HALF_UP)
-
-    if rounded == rounded.to_integral_value():
-        int_value = int(rounded)
-        if scaled == rounded:
-            return f"{int_value} {label}"
-        return f"~{int_value} {label}"
+    tenths = int(value.scaleb(1).to_integral_value(rounding=ROUND_HALF_UP))
+    sign = "-" if tenths < 0 else ""
+    whole, tenth = divmod(abs(tenths), 10)
 
-    # Strip trailing zeros (e.g. "3.0" -> keep as int above, "3.5" stays)
-    display = f"{rounded.normalize()}"
-    return f"~{display} {label}"
+    if tenth:
+        return f"~{sign}{whole}.{tenth} {label}"
+    if value == tenths // 10:
+        return f"{sign}{whole} {label}"
+    return f"~{sign}{whole} {label}"
 
 
 def _round_small(value: Decimal) -> str:
@@ -119,6 +124,6 @@ def _round_small(value: Decimal) -> str:
     one decimal place.
     """
     if value >= 10:
-        return str(int(value.quantize(Decimal("1"), rounding=ROUND_HALF_UP)))
-    rounded = value.quantize(Decimal("0.1"), rounding=ROUND_HALF_UP).normalize()
+        return str(int(value.quantize(_WHOLE, rounding=ROUND_HALF_UP)))
+    rounded = value.quantize(_ONE_DECIMAL, rounding=ROUND_HALF_UP).normalize()
     return str(rounded)
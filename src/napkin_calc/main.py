@@ -3,24 +3,28 @@
 import sys
 from pathlib import Path
 
-from PySide6.QtGui import QIcon
-from PySide6.QtWidgets import QApplication
-
-from napkin_calc.ui.main_window import MainWindow
-from napkin_calc.ui.theme import init_theme
-
 _ICON_PATH = Path(__file__).parent / "resources" / "icon.png"
 
 
 def main() -> None:
+    # Qt is imported here rather than at module level so that importing
+    # this module (e.g. to resolve the console script) stays cheap, and
+    # the widget modules load only once the QApplication exists.
+    from PySide6.QtGui import QIcon
+    from PySide6.QtWidgets import QApplication
+
     app = QApplication(sys.argv)
     app.setApplicationName("Napkin Calculator")
 
     if _ICON_PATH.exists():
         app.setWindowIcon(QIcon(str(_ICON_PATH)))
 
+    from napkin_calc.ui.theme import init_theme
+
     init_theme()  # must be called before creating any widgets
 
+    from napkin_calc.ui.main_window import MainWindow
+
     window = MainWindow()
     window.show()
 
@@ -24,6 +24,23 @@ from napkin_calc.core.engine import CalculationEngine
 
 _FORMAT_VERSION = "0.1.0"
 
+# Stored "display_mode" string -> mode, built once instead of per load.
+# Files written before the field existed fall back to estimate mode.
+_DISPLAY_MODES = {mode.value: mode for mode in CalculationMode}
+_DEFAULT_DISPLAY_MODE = CalculationMode.ESTIMATE.value
+
+
+def _parse_display_mode(value: object) -> CalculationMode:
+    """Return the mode stored as *value*, failing like ``CalculationMode()``.
+
+    Raises ``ValueError`` for unknown strings and non-string values alike,
+    so callers only need to handle one error type for a bad field.
+    """
+    try:
+        return _DISPLAY_MODES[value]
+    except (KeyError, TypeError):
+        raise ValueError(f"{value!r} is not a valid CalculationMode") from None
+
 
 class ScenarioManager:
     """Serialize / deserialize ``CalculationEngine`` state to JSON."""
@@ -35,14 +52,18 @@ class ScenarioManager:
 
     def save(self, path: Path, scenario_name: str = "") -> None:
         """Write the current engine state to *path* as JSON."""
-        data = {
-            "napkin_calc_version": _FORMAT_VERSION,
-            "scenario_name": scenario_name,
-            "events_per_second": str(self._engine.events_per_second_exact),
-            "payload_size_bytes": str(self._engine.payload_size_bytes),
-            "display_mode": self._engine.display_mode.value,
-        }
-        path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        path.write_bytes(self.encode(scenario_name))
+
+    def encode(self, scenario_name: str = "") -> bytes:
+        """Return the current engine state as ``.npkn`` file contents.
+
+        Split out from ``save`` so the UI can snapshot the state on the
+        GUI thread and write the bytes elsewhere.
+        """
+        data = self.to_dict(self._engine, scenario_name)
+        # ensure_ascii=False writes non-ASCII scenario names as UTF-8
+        # directly instead of escaping them character by character.
+        return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
 
     # -- load ---------------------------------------------------------------
 
@@ -51,23 +72,8 @@ class ScenarioManager:
 
         Returns the scenario name stored in the file (may be empty).
         """
-        text = path.read_text(encoding="utf-8")
-        data = json.loads(text)
-
-        events_per_second = Decimal(data["events_per_second"])
-        payload_size_bytes = Decimal(data["payload_size_bytes"])
-        display_mode = CalculationMode(data.get("display_mode", "estimate"))
-
-        # Restore rate by setting events/sec directly via the SECOND unit
-        self._engine.set_rate(events_per_second, TimeUnit.SECOND)
-
-        # Restore payload as raw bytes
-        self._engine.set_payload_size(payload_size_bytes, DataSizeUnit.BYTE)
-
-        # Restore display mode
-        self._engine.set_display_mode(display_mode)
-
-        return data.get("scenario_name", "")
+        # json.loads detects UTF-8 bytes itself; no text wrapper needed
+        return self.from_dict(self._engine, json.loads(path.read_bytes()))
 
     # -- helpers ------------------------------------------------------------
 
@@ -81,3 +87,28 @@ class ScenarioManager:
             "payload_size_bytes": str(engine.payload_size_bytes),
             "display_mode": engine.display_mode.value,
         }
+
+    @staticmethod
+    def from_dict(engine: CalculationEngine, data: dict) -> str:
+        """Restore *engine* from a dict shaped like ``to_dict`` output.
+
+        Returns the scenario name stored in *data* (may be empty).
+        """
+        events_per_second = Decimal(data["events_per_second"])
+        payload_size_bytes = Decimal(data["payload_size_bytes"])
+        display_mode = _parse_display_mode(
+            data.get("display_mode", _DEFAULT_DISPLAY_MODE)
+        )
+
+        # One batch so panels refresh once, after the whole scenario is in
+        with engine.batch_update():
+            # Restore rate by setting events/sec directly via the SECOND unit
+            engine.set_rate(events_per_second, TimeUnit.SECOND)
+
+            # Restore payload as raw bytes
+            engine.set_payload_size(payload_size_bytes, DataSizeUnit.BYTE)
+
+            # Restore display mode
+            engine.set_display_mode(display_mode)
+
+        return data.get("scenario_name", "")
@@ -6,10 +6,11 @@ Sits below the Traffic panel in the single-window layout.  Shows:
   data-size unit for each row, with talking points.
 """
 
-from decimal import Decimal, InvalidOperation
+from decimal import Decimal
 from functools import partial
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import QSignalBlocker, Qt, QTimer
+from PySide6.QtGui import QShowEvent
 from PySide6.QtWidgets import (
     QComboBox,
     QGridLayout,
@@ -22,24 +23,36 @@ from PySide6.QtWidgets import (
 
 from napkin_calc.core.constants import (
     TIME_UNIT_ABBREVIATIONS,
+    CalculationMode,
     DataSizeUnit,
     LockedVariable,
     TimeUnit,
+    bytes_per_unit,
+    seconds_per_unit,
 )
 from napkin_calc.core.engine import CalculationEngine
-from napkin_calc.formatting.display_formatter import DisplayFormatter
+from napkin_calc.formatting.display_formatter import format_input, scientific_notation
 from napkin_calc.formatting.talking_points import TalkingPointGenerator
-from napkin_calc.ui.widgets import LockButton, ReactiveNumberField
+from napkin_calc.ui.widgets import LockButton, ReactiveNumberField, label_font
 
 # Time units displayed in the throughput grid
-_TIME_UNIT_ORDER = [
+_TIME_UNIT_ORDER = (
     TimeUnit.SECOND,
     TimeUnit.MINUTE,
     TimeUnit.HOUR,
     TimeUnit.DAY,
     TimeUnit.MONTH,
     TimeUnit.YEAR,
-]
+)
+
+# (grid row header, time unit) and (target dropdown text, time unit) pairs
+_ROW_HEADERS = tuple(
+    (f"per {TIME_UNIT_ABBREVIATIONS[time_unit]}", time_unit)
+    for time_unit in _TIME_UNIT_ORDER
+)
+_TARGET_TIME_ITEMS = tuple(
+    (f"per {time_unit.value}", time_unit) for time_unit in _TIME_UNIT_ORDER
+)
 
 # Data-size units offered in the payload-size dropdown
 _PAYLOAD_UNITS = [
@@ -64,13 +77,13 @@ class DataVolumePanel(QWidget):
     def __init__(self, engine: CalculationEngine, parent=None) -> None:
         super().__init__(parent)
         self._engine = engine
-        self._formatter = DisplayFormatter()
-        self._talker = TalkingPointGenerator()
 
         self._throughput_value_labels: dict[TimeUnit, QLabel] = {}
         self._throughput_notation_labels: dict[TimeUnit, QLabel] = {}
         self._throughput_talking_labels: dict[TimeUnit, QLabel] = {}
-        self._is_updating = False
+        self._refresh_pending = False
+        # Set when a refresh was skipped because the panel was hidden
+        self._dirty = False
 
         self._build_ui()
         self._connect_signals()
@@ -119,8 +132,8 @@ class DataVolumePanel(QWidget):
         payload_layout.addWidget(self._target_size_unit_combo, 1, 3)
 
         self._target_time_unit_combo = QComboBox()
-        for time_unit in _TIME_UNIT_ORDER:
-            self._target_time_unit_combo.addItem(f"per {time_unit.value}", time_unit)
+        for text, time_unit in _TARGET_TIME_ITEMS:
+            self._target_time_unit_combo.addItem(text, time_unit)
         self._target_time_unit_combo.setCurrentIndex(3)  # Day
         payload_layout.addWidget(self._target_time_unit_combo, 1, 4)
 
@@ -147,12 +160,9 @@ class DataVolumePanel(QWidget):
         grid.setColumnStretch(2, 0)
         grid.setColumnStretch(3, 1)
 
-        for row_index, time_unit in enumerate(_TIME_UNIT_ORDER, start=1):
-            abbreviation = TIME_UNIT_ABBREVIATIONS[time_unit]
-            unit_label = QLabel(f"per {abbreviation}")
-            font = unit_label.font()
-            font.setBold(True)
-            unit_label.setFont(font)
+        for row_index, (header, time_unit) in enumerate(_ROW_HEADERS, start=1):
+            unit_label = QLabel(header)
+            unit_label.setFont(label_font(bold=True))
             grid.addWidget(unit_label, row_index, 0)
 
             # Data volume value (read-only)
@@ -172,9 +182,7 @@ class DataVolumePanel(QWidget):
             notation_label.setAlignment(
                 Qt.AlignmentFlag.AlignCenter | Qt.AlignmentFlag.AlignVCenter
             )
-            font = notation_label.font()
-            font.setBold(True)
-            notation_label.setFont(font)
+            notation_label.setFont(label_font(bold=True))
             self._throughput_notation_labels[time_unit] = notation_label
             grid.addWidget(notation_label, row_index, 2)
 
@@ -183,9 +191,7 @@ class DataVolumePanel(QWidget):
             talking_label.setAlignment(
                 Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
             )
-            font = talking_label.font()
-            font.setItalic(True)
-            talking_label.setFont(font)
+            talking_label.setFont(label_font(italic=True))
             talking_label.setTextInteractionFlags(
                 Qt.TextInteractionFlag.TextSelectableByMouse
             )
@@ -198,9 +204,7 @@ class DataVolumePanel(QWidget):
     @staticmethod
     def _header_label(text: str) -> QLabel:
         label = QLabel(text)
-        font = label.font()
-        font.setBold(True)
-        label.setFont(font)
+        label.setFont(label_font(bold=True))
         return label
 
     # -- signal wiring ------------------------------------------------------
@@ -222,8 +226,11 @@ class DataVolumePanel(QWidget):
         self._volume_lock.clicked.connect(self._on_volume_lock_clicked)
         self._engine.lock_changed.connect(self._sync_lock_buttons)
 
-        self._engine.storage_changed.connect(self._refresh_all)
-        self._engine.mode_changed.connect(self._refresh_all)
+        self._engine.storage_changed.connect(self._schedule_refresh)
+        self._engine.mode_changed.connect(self._schedule_refresh)
+        # Resetting a clean engine emits only reset_occurred, but the payload
+        # field and unit dropdown may still hold what the user typed
+        self._engine.reset_occurred.connect(self._schedule_refresh)
 
     def _on_payload_lock_clicked(self) -> None:
         self._engine.set_locked_variable(LockedVariable.PAYLOAD)
@@ -239,81 +246,111 @@ class DataVolumePanel(QWidget):
 
     def _on_payload_edited(self, value: Decimal) -> None:
         """User typed a new payload size."""
-        if self._is_updating:
-            return
         unit = self._payload_unit_combo.currentData()
         self._engine.set_payload_size(value, unit)
+        # A no-op edit emits nothing; redraw anyway to normalise the text
+        self._schedule_refresh()
 
     def _on_payload_unit_changed(self) -> None:
         """User changed the payload-size unit dropdown."""
-        text = self._payload_field.text().strip().replace(",", "")
-        if not text:
-            return
-        try:
-            value = Decimal(text)
-        except InvalidOperation:
+        value = self._payload_field.current_value()
+        if value is None:
             return
         unit = self._payload_unit_combo.currentData()
+        # Skip the solve + grid refresh if the byte count is unchanged
+        new_bytes = value * bytes_per_unit(unit, CalculationMode.EXACT)
+        if new_bytes == self._engine.payload_size_bytes:
+            return
         self._engine.set_payload_size(value, unit)
 
     def _on_target_edited(self, value: Decimal) -> None:
         """User typed a new target throughput."""
-        if self._is_updating:
-            return
         size_unit = self._target_size_unit_combo.currentData()
         time_unit = self._target_time_unit_combo.currentData()
         self._engine.set_target_throughput(value, size_unit, time_unit)
 
     def _on_target_unit_changed(self) -> None:
         """User changed one of the target dropdowns."""
-        text = self._target_field.text().strip().replace(",", "")
-        if not text:
-            return
-        try:
-            value = Decimal(text)
-        except InvalidOperation:
+        value = self._target_field.current_value()
+        if value is None:
             return
         size_unit = self._target_size_unit_combo.currentData()
         time_unit = self._target_time_unit_combo.currentData()
+        # Skip the solve + grid refresh if the target rate is unchanged
+        new_target_bps = (
+            value
+            * bytes_per_unit(size_unit, CalculationMode.EXACT)
+            / seconds_per_unit(time_unit, CalculationMode.EXACT)
+        )
+        if new_target_bps == self._engine.pending_target_bytes_per_second:
+            return
         self._engine.set_target_throughput(value, size_unit, time_unit)
 
     # -- display refresh ----------------------------------------------------
 
+    def showEvent(self, event: QShowEvent) -> None:
+        """Catch up on any refresh skipped while the panel was hidden."""
+        super().showEvent(event)
+        if self._dirty:
+            self._refresh_all()
+
+    def _schedule_refresh(self) -> None:
+        """Refresh once on the next event-loop pass.
+
+        Several engine signals in the same tick (e.g. a scenario load that
+        sets rate, payload and mode) collapse into a single refresh.
+        """
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            QTimer.singleShot(0, self._run_scheduled_refresh)
+
+    def _run_scheduled_refresh(self) -> None:
+        self._refresh_pending = False
+        self._refresh_all()
+
     def _refresh_all(self) -> None:
         """Refresh the payload field and all throughput rows from engine state."""
-        self._is_updating = True
-        try:
+        if not self.isVisible():
+            self._dirty = True
+            return
+        self._dirty = False
+
+        # Block the input widgets' signals so the programmatic updates
+        # below don't loop back into the engine.
+        with (
+            QSignalBlocker(self._payload_field),
+            QSignalBlocker(self._payload_unit_combo),
+            QSignalBlocker(self._target_field),
+        ):
             # Update payload input field
-            if self._engine.payload_size_bytes == 0:
+            if self._engine.payload_size_bytes.is_zero():
                 self._payload_field.set_display_value("")
                 self._payload_unit_combo.setCurrentIndex(1)  # default to KB
             else:
                 unit = self._payload_unit_combo.currentData()
                 exact_value = self._engine.get_payload_size(unit)
                 self._payload_field.set_display_value(
-                    self._formatter.format_input(exact_value)
+                    format_input(exact_value)
                 )
 
             # Update target total volume input field
             target_time_unit = self._target_time_unit_combo.currentData()
             target_size_unit = self._target_size_unit_combo.currentData()
             target_value = self._engine.get_data_throughput(target_time_unit, target_size_unit)
-            if target_value == 0:
+            if target_value.is_zero():
                 self._target_field.set_display_value("")
             else:
                 self._target_field.set_display_value(
-                    self._formatter.format_input(target_value)
+                    format_input(target_value)
                 )
 
+            rows = self._engine.get_all_throughputs()
             for time_unit in _TIME_UNIT_ORDER:
-                value, best_unit = self._engine.get_data_throughput_best_unit(
-                    time_unit
-                )
-                total_bytes = self._engine.get_data_throughput_bytes(time_unit)
+                total_bytes, value, best_unit = rows[time_unit]
 
                 # Value with auto-selected unit
                 display_text = (
-                    f"{self._formatter.format_input(value)} {best_unit.value}"
+                    f"{format_input(value)} {best_unit.value}"
                     if total_bytes > 0
                     else ""
                 )
@@ -321,15 +358,13 @@ class DataVolumePanel(QWidget):
 
                 # Scientific notation on the raw byte count
                 self._throughput_notation_labels[time_unit].setText(
-                    self._formatter.scientific_notation(total_bytes)
+                    scientific_notation(total_bytes)
                 )
 
                 # Talking point
                 talking = (
-                    self._talker.generate_data_size(value, best_unit)
+                    TalkingPointGenerator.generate_data_size(value, best_unit)
                     if total_bytes > 0
                     else ""
                 )
                 self._throughput_talking_labels[time_unit].setText(talking)
-        finally:
-            self._is_updating = False
@@ -6,7 +6,8 @@ bandwidth and round-trip time.
 
 from decimal import Decimal, InvalidOperation
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import QSignalBlocker, Qt, QTimer
+from PySide6.QtGui import QColor, QPalette, QShowEvent
 from PySide6.QtWidgets import (
     QComboBox,
     QGridLayout,
@@ -21,9 +22,12 @@ from napkin_calc.core.constants import BandwidthUnit, DataSizeUnit
 from napkin_calc.core.data_converter import DataSizeConverter
 from napkin_calc.core.dbp_calculator import DBPCalculator
 from napkin_calc.core.engine import CalculationEngine
-from napkin_calc.formatting.display_formatter import DisplayFormatter
+from napkin_calc.formatting.display_formatter import format_value
 from napkin_calc.formatting.talking_points import TalkingPointGenerator
-from napkin_calc.ui.widgets import ReactiveNumberField
+from napkin_calc.ui.widgets import ReactiveNumberField, label_font
+
+# Accent color of the "Data in Flight" result, readable in both themes
+_OUTPUT_COLOR = QColor(0x40, 0x8C, 0xD2)
 
 _BANDWIDTH_UNITS = [
     BandwidthUnit.MBPS,
@@ -39,9 +43,10 @@ class DBPPanel(QWidget):
         super().__init__(parent)
         self._engine = engine
         self._calculator = DBPCalculator()
-        self._formatter = DisplayFormatter()
-        self._talker = TalkingPointGenerator()
-        self._is_updating = False
+        self._converter = DataSizeConverter()
+        self._refresh_pending = False
+        # Set when a refresh was skipped because the panel was hidden
+        self._dirty = False
 
         self._build_ui()
         self._connect_signals()
@@ -89,13 +94,15 @@ class DBPPanel(QWidget):
         layout.addWidget(self._header_label("Data in Flight:"), 2, 0)
 
         self._output_label = QLabel("0")
-        self._output_label.setStyleSheet("font-weight: bold; color: #408cd2;")
+        self._output_label.setFont(label_font(bold=True))
+        # Explicitly set roles survive application palette (theme) changes
+        output_palette = self._output_label.palette()
+        output_palette.setColor(QPalette.ColorRole.WindowText, _OUTPUT_COLOR)
+        self._output_label.setPalette(output_palette)
         self._output_label.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
         
         self._output_talking_label = QLabel("")
-        font = self._output_talking_label.font()
-        font.setItalic(True)
-        self._output_talking_label.setFont(font)
+        self._output_talking_label.setFont(label_font(italic=True))
 
         out_layout = QHBoxLayout()
         out_layout.addWidget(self._output_label)
@@ -110,9 +117,7 @@ class DBPPanel(QWidget):
     @staticmethod
     def _header_label(text: str) -> QLabel:
         label = QLabel(text)
-        font = label.font()
-        font.setBold(True)
-        label.setFont(font)
+        label.setFont(label_font(bold=True))
         return label
 
     # -- signal wiring ------------------------------------------------------
@@ -122,25 +127,47 @@ class DBPPanel(QWidget):
         self._bw_unit_combo.currentIndexChanged.connect(self._on_input_changed)
         self._rtt_field.value_changed.connect(self._on_input_changed)
 
-        self._engine.mode_changed.connect(self._refresh_output)
+        self._engine.mode_changed.connect(self._schedule_refresh)
         self._engine.reset_occurred.connect(self._on_reset)
 
     def _on_input_changed(self, *args) -> None:
-        if self._is_updating:
-            return
-        self._refresh_output()
+        self._schedule_refresh()
 
     def _on_reset(self) -> None:
-        self._is_updating = True
-        self._bw_field.set_display_value("")
-        self._rtt_field.set_display_value("")
-        self._bw_unit_combo.setCurrentIndex(1)
-        self._is_updating = False
+        with (
+            QSignalBlocker(self._bw_field),
+            QSignalBlocker(self._rtt_field),
+            QSignalBlocker(self._bw_unit_combo),
+        ):
+            self._bw_field.set_display_value("")
+            self._rtt_field.set_display_value("")
+            self._bw_unit_combo.setCurrentIndex(1)
         self._refresh_output()
 
     # -- display refresh ----------------------------------------------------
 
+    def showEvent(self, event: QShowEvent) -> None:
+        """Catch up on any refresh skipped while the panel was hidden."""
+        super().showEvent(event)
+        if self._dirty:
+            self._refresh_output()
+
+    def _schedule_refresh(self) -> None:
+        """Recompute the output once on the next event-loop pass."""
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            QTimer.singleShot(0, self._run_scheduled_refresh)
+
+    def _run_scheduled_refresh(self) -> None:
+        self._refresh_pending = False
+        self._refresh_output()
+
     def _refresh_output(self) -> None:
+        if not self.isVisible():
+            self._dirty = True
+            return
+        self._dirty = False
+
         bw_text = self._bw_field.text().strip().replace(",", "")
         rtt_text = self._rtt_field.text().strip().replace(",", "")
 
@@ -163,20 +190,20 @@ class DBPPanel(QWidget):
 
         total_bytes = self._calculator.data_in_flight_bytes
 
-        if total_bytes == 0:
+        if total_bytes.is_zero():
             self._output_label.setText("0")
             self._output_talking_label.setText("")
             return
 
         # Auto-select the best unit to display
-        converter = DataSizeConverter()
+        converter = self._converter
         converter.size_in_bytes = total_bytes
         best_unit = converter.best_unit(mode)
         display_val = converter.get_size(best_unit, mode)
 
         # Format output
-        text = f"{self._formatter.format_value(display_val)} {best_unit.value}"
-        talking = self._talker.generate_data_size(display_val, best_unit)
+        text = f"{format_value(display_val)} {best_unit.value}"
+        talking = TalkingPointGenerator.generate_data_size(display_val, best_unit)
 
         self._output_label.setText(text)
         self._output_talking_label.setText(talking)
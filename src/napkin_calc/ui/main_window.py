@@ -2,7 +2,16 @@
 
 from pathlib import Path
 
-from PySide6.QtCore import Qt, QSize
+from PySide6.QtCore import (
+    QObject,
+    QRunnable,
+    QSettings,
+    QSize,
+    Qt,
+    QThreadPool,
+    QTimer,
+    Signal,
+)
 from PySide6.QtGui import QIcon, QImage, QPixmap
 from PySide6.QtWidgets import (
     QFileDialog,
@@ -30,7 +39,41 @@ from napkin_calc.ui.theme import apply_dark, apply_light, is_dark
 from napkin_calc.ui.traffic_panel import TrafficPanel
 
 _FILE_FILTER = "Napkin Scenarios (*.npkn)"
-_ICON_PATH = Path(__file__).parent.parent / "resources" / "icon.png"
+_COLUMN_ALIGNMENT = Qt.AlignmentFlag.AlignTop
+
+# Save / Load start here until the user picks a directory; the last one
+# used is remembered across sessions under _LAST_DIR_KEY.
+_DEFAULT_SAVE_DIR = str(Path.home())
+_LAST_DIR_KEY = "last_save_dir"
+
+
+class _SaveSignals(QObject):
+    """Completion signals for ``_SaveTask`` (QRunnable is not a QObject)."""
+
+    failed = Signal(str)
+    finished = Signal()
+
+
+class _SaveTask(QRunnable):
+    """Write an encoded scenario to disk on a worker thread.
+
+    The engine state is encoded on the GUI thread beforehand, so the
+    worker only touches the file system.
+    """
+
+    def __init__(self, path: Path, contents: bytes) -> None:
+        super().__init__()
+        self.signals = _SaveSignals()
+        self._path = path
+        self._contents = contents
+
+    def run(self) -> None:
+        try:
+            self._path.write_bytes(self._contents)
+        except OSError as exc:
+            self.signals.failed.emit(str(exc))
+        finally:
+            self.signals.finished.emit()
 
 
 class MainWindow(QMainWindow):
@@ -43,22 +86,42 @@ class MainWindow(QMainWindow):
 
     _WINDOW_TITLE = "Napkin Calculator – System Design Estimator"
     _DEFAULT_SIZE = (960, 700)
+    _EXACT_DESCRIPTION = (
+        "1 KB = 1,024 B  \u00b7  1 month = 30.44 days  \u00b7  1 year = 365.25 days"
+    )
+    _ESTIMATE_DESCRIPTION = (
+        "1 KB = 1,000 B  \u00b7  1 month = 30 days  \u00b7  1 year = 365 days"
+    )
+    # Quiet period after the last resize event before the column layout
+    # is re-evaluated, so dragging a window edge reflows only once.
+    _RELAYOUT_DELAY_MS = 50
 
     def __init__(self) -> None:
         super().__init__()
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(self._RELAYOUT_DELAY_MS)
+        self._resize_timer.timeout.connect(self._apply_layout_mode)
+
         self.setWindowTitle(self._WINDOW_TITLE)
         self.resize(*self._DEFAULT_SIZE)
-
-        if _ICON_PATH.exists():
-            self.setWindowIcon(QIcon(str(_ICON_PATH)))
+        # No setWindowIcon here: main() sets the application icon, which
+        # every window inherits, so the PNG is decoded only once.
 
         self._engine = CalculationEngine(parent=self)
         self._scenario_manager = ScenarioManager(self._engine)
-        self._last_save_dir = str(Path.home())
+        self._settings = QSettings("napkin-calc", "napkin-calc")
+        self._last_save_dir = self._settings.value(
+            _LAST_DIR_KEY, _DEFAULT_SAVE_DIR, type=str
+        )
+        self._file_dialog: QFileDialog | None = None
+        self._save_task: _SaveTask | None = None
 
         self._build_toolbar()
         self._build_central_area()
         self._update_mode_indicator()
+        # Only an actual mode change (toggle or loaded scenario) redraws it
+        self._engine.mode_changed.connect(self._update_mode_indicator)
 
     # -- toolbar ------------------------------------------------------------
 
@@ -118,6 +181,14 @@ class MainWindow(QMainWindow):
         self._reset_button.clicked.connect(self._on_reset)
         toolbar.addWidget(self._reset_button)
 
+        # Icons come from the Fusion style, which never changes after
+        # init_theme(), so look them up once.  Save and Load work in
+        # both themes; only Reset needs a dark-mode variant.
+        style = self.style()
+        self._save_button.setIcon(style.standardIcon(QStyle.StandardPixmap.SP_DriveFDIcon))
+        self._load_button.setIcon(style.standardIcon(QStyle.StandardPixmap.SP_DialogOpenButton))
+        self._reset_icon_light = style.standardIcon(QStyle.StandardPixmap.SP_BrowserReload)
+        self._reset_icon_dark = self._inverted_icon(self._reset_icon_light)
         self._refresh_toolbar_icons()
 
     @staticmethod
@@ -131,36 +202,27 @@ class MainWindow(QMainWindow):
     def _refresh_toolbar_icons(self) -> None:
         """Re-set toolbar icons for the current theme.
 
-        Save and Load work in both themes.  The Reset icon is
-        color-inverted in dark mode so it stays visible.
+        The Reset icon is color-inverted in dark mode so it stays visible.
         """
-        style = self.style()
-        self._save_button.setIcon(style.standardIcon(QStyle.StandardPixmap.SP_DriveFDIcon))
-        self._load_button.setIcon(style.standardIcon(QStyle.StandardPixmap.SP_DialogOpenButton))
-        reset_icon = style.standardIcon(QStyle.StandardPixmap.SP_BrowserReload)
         if is_dark():
-            reset_icon = self._inverted_icon(reset_icon)
-        self._reset_button.setIcon(reset_icon)
+            self._reset_button.setIcon(self._reset_icon_dark)
+        else:
+            self._reset_button.setIcon(self._reset_icon_light)
 
     # -- mode toggle --------------------------------------------------------
 
     def _on_mode_toggled(self) -> None:
         self._engine.toggle_display_mode()
-        self._update_mode_indicator()
 
     def _update_mode_indicator(self) -> None:
         is_exact = self._engine.display_mode == CalculationMode.EXACT
         self._mode_button.setChecked(is_exact)
         if is_exact:
             self._mode_button.setText("Mode: EXACT")
-            self._mode_label.setText(
-                "1 KB = 1,024 B  \u00b7  1 month = 30.44 days  \u00b7  1 year = 365.25 days"
-            )
+            self._mode_label.setText(self._EXACT_DESCRIPTION)
         else:
             self._mode_button.setText("Mode: ESTIMATE")
-            self._mode_label.setText(
-                "1 KB = 1,000 B  \u00b7  1 month = 30 days  \u00b7  1 year = 365 days"
-            )
+            self._mode_label.setText(self._ESTIMATE_DESCRIPTION)
 
     # -- theme toggle -------------------------------------------------------
 
@@ -182,39 +244,73 @@ class MainWindow(QMainWindow):
 
     # -- save / load --------------------------------------------------------
 
+    def _scenario_dialog(
+        self, caption: str, accept_mode: QFileDialog.AcceptMode
+    ) -> QFileDialog:
+        """Return the shared Save / Load dialog, set up for one use.
+
+        One dialog is kept and reused rather than building a new one
+        (and re-listing the directory) on every Save or Load.
+        """
+        if self._file_dialog is None:
+            self._file_dialog = QFileDialog(self)
+            self._file_dialog.setNameFilter(_FILE_FILTER)
+            self._file_dialog.setOption(
+                QFileDialog.Option.DontUseCustomDirectoryIcons, True
+            )
+        dialog = self._file_dialog
+        dialog.setWindowTitle(caption)
+        dialog.setAcceptMode(accept_mode)
+        dialog.setFileMode(
+            QFileDialog.FileMode.AnyFile
+            if accept_mode == QFileDialog.AcceptMode.AcceptSave
+            else QFileDialog.FileMode.ExistingFile
+        )
+        dialog.setDirectory(self._last_save_dir)
+        return dialog
+
+    def _remember_dir(self, directory: Path) -> None:
+        """Start the next Save / Load in *directory*, now and next session."""
+        self._last_save_dir = str(directory)
+        self._settings.setValue(_LAST_DIR_KEY, self._last_save_dir)
+
     def _on_save(self) -> None:
-        file_path, _ = QFileDialog.getSaveFileName(
-            self,
-            "Save Scenario",
-            self._last_save_dir,
-            _FILE_FILTER,
+        dialog = self._scenario_dialog(
+            "Save Scenario", QFileDialog.AcceptMode.AcceptSave
         )
-        if not file_path:
+        if not dialog.exec():
             return
 
-        path = Path(file_path)
+        path = Path(dialog.selectedFiles()[0])
         if path.suffix != ".npkn":
             path = path.with_suffix(".npkn")
 
-        self._last_save_dir = str(path.parent)
+        self._remember_dir(path.parent)
 
-        try:
-            self._scenario_manager.save(path, scenario_name=path.stem)
-        except OSError as exc:
-            QMessageBox.warning(self, "Save Failed", str(exc))
+        # Encode here, write on a worker so a slow disk can't freeze the UI
+        task = _SaveTask(path, self._scenario_manager.encode(path.stem))
+        task.signals.failed.connect(self._on_save_failed)
+        task.signals.finished.connect(self._on_save_finished)
+        self._save_task = task
+        self._save_button.setEnabled(False)
+        QThreadPool.globalInstance().start(task)
+
+    def _on_save_failed(self, message: str) -> None:
+        QMessageBox.warning(self, "Save Failed", message)
+
+    def _on_save_finished(self) -> None:
+        self._save_task = None
+        self._save_button.setEnabled(True)
 
     def _on_load(self) -> None:
-        file_path, _ = QFileDialog.getOpenFileName(
-            self,
-            "Load Scenario",
-            self._last_save_dir,
-            _FILE_FILTER,
+        dialog = self._scenario_dialog(
+            "Load Scenario", QFileDialog.AcceptMode.AcceptOpen
         )
-        if not file_path:
+        if not dialog.exec():
             return
 
-        path = Path(file_path)
-        self._last_save_dir = str(path.parent)
+        path = Path(dialog.selectedFiles()[0])
+        self._remember_dir(path.parent)
 
         try:
             scenario_name = self._scenario_manager.load(path)
@@ -222,7 +318,6 @@ class MainWindow(QMainWindow):
                 self.setWindowTitle(
                     f"{self._WINDOW_TITLE}  \u2014  {scenario_name}"
                 )
-            self._update_mode_indicator()
         except (OSError, KeyError, ValueError) as exc:
             QMessageBox.warning(self, "Load Failed", str(exc))
 
@@ -245,7 +340,6 @@ class MainWindow(QMainWindow):
         left_layout.setContentsMargins(0, 0, 0, 0)
         left_layout.addWidget(TrafficPanel(self._engine))
         left_layout.addWidget(DataVolumePanel(self._engine))
-        left_layout.addStretch()
 
         # Right Column (Utilities and References)
         self._right_col = QWidget()
@@ -253,11 +347,11 @@ class MainWindow(QMainWindow):
         right_layout.setContentsMargins(0, 0, 0, 0)
         right_layout.addWidget(DBPPanel(self._engine))
         right_layout.addWidget(ReferencePanel())
-        right_layout.addStretch()
 
-        # Initial placement
-        self._grid.addWidget(self._left_col, 0, 0)
-        self._grid.addWidget(self._right_col, 0, 1)
+        # Initial placement.  Top-aligning the columns keeps each panel
+        # at its natural height, with spare space left below the cells.
+        self._grid.addWidget(self._left_col, 0, 0, _COLUMN_ALIGNMENT)
+        self._grid.addWidget(self._right_col, 0, 1, _COLUMN_ALIGNMENT)
         self._is_two_col = True
 
         # Stretch so panels don't expand infinitely if window is huge
@@ -269,9 +363,12 @@ class MainWindow(QMainWindow):
         self.setCentralWidget(self._scroll)
 
     def resizeEvent(self, event) -> None:
-        """Dynamically switch between 1-column and 2-column layouts based on window width."""
+        """Re-evaluate the column layout once resizing settles."""
         super().resizeEvent(event)
+        self._resize_timer.start()
 
+    def _apply_layout_mode(self) -> None:
+        """Switch between 1-column and 2-column layouts based on window width."""
         left_width = self._left_col.minimumSizeHint().width()
         right_width = self._right_col.minimumSizeHint().width()
         margins = self._grid.contentsMargins()
@@ -282,9 +379,9 @@ class MainWindow(QMainWindow):
 
         if self.width() >= required_width and not self._is_two_col:
             self._grid.removeWidget(self._right_col)
-            self._grid.addWidget(self._right_col, 0, 1)
+            self._grid.addWidget(self._right_col, 0, 1, _COLUMN_ALIGNMENT)
             self._is_two_col = True
         elif self.width() < required_width and self._is_two_col:
             self._grid.removeWidget(self._right_col)
-            self._grid.addWidget(self._right_col, 1, 0)
+            self._grid.addWidget(self._right_col, 1, 0, _COLUMN_ALIGNMENT)
             self._is_two_col = False
@@ -15,6 +15,7 @@ from PySide6.QtWidgets import (
 )
 
 from napkin_calc.core.constants import REFERENCE_LATENCY, REFERENCE_NINES
+from napkin_calc.ui.widgets import label_font
 
 
 class ReferencePanel(QWidget):
@@ -66,7 +67,5 @@ class ReferencePanel(QWidget):
     @staticmethod
     def _header_label(text: str) -> QLabel:
         label = QLabel(text)
-        font = label.font()
-        font.setBold(True)
-        label.setFont(font)
+        label.setFont(label_font(bold=True))
         return label
@@ -6,9 +6,12 @@ between an explicit light and dark palette.
 
 Every color role is set for every color group (All + Disabled) so that
 no colors are inherited from the previous palette or from Qt's
-automatic derivation.
+automatic derivation.  Each palette is built once and reused on later
+toggles; ``QApplication.setPalette`` takes a copy, so sharing is safe.
 """
 
+from functools import cache
+
 from PySide6.QtGui import QColor, QPalette
 from PySide6.QtWidgets import QApplication
 
@@ -35,6 +38,7 @@ def _set_all(palette: QPalette, role: QPalette.ColorRole, color: QColor) -> None
 # Light palette
 # ---------------------------------------------------------------------------
 
+@cache
 def _build_light_palette() -> QPalette:
     palette = QPalette()
 
@@ -75,6 +79,7 @@ def _build_light_palette() -> QPalette:
 # Dark palette
 # ---------------------------------------------------------------------------
 
+@cache
 def _build_dark_palette() -> QPalette:
     palette = QPalette()
 
@@ -118,9 +123,9 @@ def apply_light() -> None:
     global _is_dark
     QApplication.setPalette(_build_light_palette())
     _is_dark = False
-    # Force a full repaint of all widgets
+    # Schedule a repaint of all widgets; update() lets Qt coalesce them
     for widget in QApplication.topLevelWidgets():
-        widget.repaint()
+        widget.update()
 
 
 def apply_dark() -> None:
@@ -129,7 +134,7 @@ def apply_dark() -> None:
     QApplication.setPalette(_build_dark_palette())
     _is_dark = True
     for widget in QApplication.topLevelWidgets():
-        widget.repaint()
+        widget.update()
 
 
 def is_dark() -> bool:
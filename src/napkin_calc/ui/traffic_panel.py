@@ -11,7 +11,7 @@ Editing any field recalculates all others via the ``CalculationEngine``.
 from decimal import Decimal
 from functools import partial
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import QSignalBlocker, Qt, QTimer
 from PySide6.QtWidgets import (
     QGridLayout,
     QGroupBox,
@@ -21,21 +21,31 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
-from napkin_calc.core.constants import TIME_UNIT_ABBREVIATIONS, LockedVariable, TimeUnit
+from napkin_calc.core.constants import (
+    TIME_UNIT_ABBREVIATIONS,
+    CalculationMode,
+    LockedVariable,
+    TimeUnit,
+)
 from napkin_calc.core.engine import CalculationEngine
-from napkin_calc.formatting.display_formatter import DisplayFormatter
+from napkin_calc.formatting.display_formatter import format_input, scientific_notation
 from napkin_calc.formatting.talking_points import TalkingPointGenerator
-from napkin_calc.ui.widgets import LockButton, ReactiveNumberField
+from napkin_calc.ui.widgets import LockButton, ReactiveNumberField, label_font
 
 # The order in which time units appear in the grid (top to bottom)
-_UNIT_ORDER = [
+_UNIT_ORDER = (
     TimeUnit.SECOND,
     TimeUnit.MINUTE,
     TimeUnit.HOUR,
     TimeUnit.DAY,
     TimeUnit.MONTH,
     TimeUnit.YEAR,
-]
+)
+
+# (grid row header, time unit) pairs
+_ROW_HEADERS = tuple(
+    (f"per {TIME_UNIT_ABBREVIATIONS[unit]}", unit) for unit in _UNIT_ORDER
+)
 
 
 class TrafficPanel(QWidget):
@@ -52,14 +62,25 @@ class TrafficPanel(QWidget):
     def __init__(self, engine: CalculationEngine, parent=None) -> None:
         super().__init__(parent)
         self._engine = engine
-        self._formatter = DisplayFormatter()
-        self._talker = TalkingPointGenerator()
         self._fields: dict[TimeUnit, ReactiveNumberField] = {}
         self._notation_labels: dict[TimeUnit, QLabel] = {}
         self._talking_labels: dict[TimeUnit, QLabel] = {}
-        self._is_updating = False
+        # (events/sec, display mode) the rows currently show
+        self._rendered_state: tuple[Decimal, CalculationMode] | None = None
+        self._refresh_pending = False
 
         self._build_ui()
+        # Per-row (unit, field, notation setter, talking-point setter),
+        # bound once so refreshes don't index three dicts per row
+        self._rows = tuple(
+            (
+                unit,
+                self._fields[unit],
+                self._notation_labels[unit].setText,
+                self._talking_labels[unit].setText,
+            )
+            for unit in _UNIT_ORDER
+        )
         self._connect_signals()
 
     # -- UI construction ----------------------------------------------------
@@ -98,13 +119,10 @@ class TrafficPanel(QWidget):
         grid.setColumnStretch(2, 0)
         grid.setColumnStretch(3, 1)
 
-        for row_index, unit in enumerate(_UNIT_ORDER, start=1):
+        for row_index, (header, unit) in enumerate(_ROW_HEADERS, start=1):
             # Unit label (abbreviated)
-            abbreviation = TIME_UNIT_ABBREVIATIONS[unit]
-            unit_label = QLabel(f"per {abbreviation}")
-            font = unit_label.font()
-            font.setBold(True)
-            unit_label.setFont(font)
+            unit_label = QLabel(header)
+            unit_label.setFont(label_font(bold=True))
             grid.addWidget(unit_label, row_index, 0)
 
             # Editable numeric field
@@ -117,9 +135,7 @@ class TrafficPanel(QWidget):
             notation_label.setAlignment(
                 Qt.AlignmentFlag.AlignCenter | Qt.AlignmentFlag.AlignVCenter
             )
-            font = notation_label.font()
-            font.setBold(True)
-            notation_label.setFont(font)
+            notation_label.setFont(label_font(bold=True))
             self._notation_labels[unit] = notation_label
             grid.addWidget(notation_label, row_index, 2)
 
@@ -128,9 +144,7 @@ class TrafficPanel(QWidget):
             talking_label.setAlignment(
                 Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
             )
-            font = talking_label.font()
-            font.setItalic(True)
-            talking_label.setFont(font)
+            talking_label.setFont(label_font(italic=True))
             talking_label.setTextInteractionFlags(
                 Qt.TextInteractionFlag.TextSelectableByMouse
             )
@@ -145,9 +159,7 @@ class TrafficPanel(QWidget):
     @staticmethod
     def _header_label(text: str) -> QLabel:
         label = QLabel(text)
-        font = label.font()
-        font.setBold(True)
-        label.setFont(font)
+        label.setFont(label_font(bold=True))
         return label
 
     # -- signal wiring ------------------------------------------------------
@@ -159,8 +171,9 @@ class TrafficPanel(QWidget):
         self._lock_button.clicked.connect(self._on_lock_clicked)
         self._engine.lock_changed.connect(self._sync_lock_button)
 
-        self._engine.rates_changed.connect(self._refresh_all)
-        self._engine.mode_changed.connect(self._refresh_all)
+        self._engine.rates_changed.connect(self._schedule_refresh)
+        self._engine.mode_changed.connect(self._schedule_refresh)
+        self._engine.reset_occurred.connect(self._on_reset)
 
     def _on_lock_clicked(self) -> None:
         self._engine.set_locked_variable(LockedVariable.RATE)
@@ -173,32 +186,56 @@ class TrafficPanel(QWidget):
 
     def _on_field_edited(self, unit: TimeUnit, value: Decimal) -> None:
         """User changed a rate field – push into the engine."""
-        if self._is_updating:
-            return
+        # The field now shows the user's text rather than the rendered
+        # state, so the next refresh must redraw even if the rate is equal.
+        self._rendered_state = None
         self._engine.set_rate(value, unit)
+        # A no-op edit emits nothing; redraw anyway to normalise the text
+        self._schedule_refresh()
 
     # -- display refresh ----------------------------------------------------
 
+    def _on_reset(self) -> None:
+        """Redraw every row after a reset, even if the engine was already zero.
+
+        Resetting a clean engine emits only ``reset_occurred``, but the
+        fields may still hold text the user typed without changing the rate.
+        """
+        self._rendered_state = None
+        self._schedule_refresh()
+
+    def _schedule_refresh(self) -> None:
+        """Refresh once on the next event-loop pass.
+
+        A rate change and a mode change in the same tick collapse into a
+        single refresh.
+        """
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            QTimer.singleShot(0, self._run_scheduled_refresh)
+
+    def _run_scheduled_refresh(self) -> None:
+        self._refresh_pending = False
+        self._refresh_all()
+
     def _refresh_all(self) -> None:
         """Recompute every row from engine state.
 
-        Uses the ``_is_updating`` guard so that programmatically setting
-        field text does not re-trigger ``_on_field_edited``.
+        Each field's signals are blocked while its text is set, so the
+        programmatic update does not re-trigger ``_on_field_edited``.
+        Skipped entirely when the rate and mode match what is on screen.
         """
-        self._is_updating = True
-        try:
-            for unit in _UNIT_ORDER:
-                display_value = self._engine.get_rate(unit)
-                exact_value = self._engine.get_rate_exact(unit)
-
-                self._fields[unit].set_display_value(
-                    self._formatter.format_input(exact_value)
-                )
-                self._notation_labels[unit].setText(
-                    self._formatter.scientific_notation(display_value)
-                )
-                self._talking_labels[unit].setText(
-                    self._talker.generate(display_value)
-                )
-        finally:
-            self._is_updating = False
+        state = (self._engine.events_per_second_exact, self._engine.display_mode)
+        if state == self._rendered_state:
+            return
+        self._rendered_state = state
+
+        get_rate = self._engine.get_rate
+        get_rate_exact = self._engine.get_rate_exact
+        generate = TalkingPointGenerator.generate
+        for unit, field, set_notation, set_talking in self._rows:
+            display_value = get_rate(unit)
+            with QSignalBlocker(field):
+                field.set_display_value(format_input(get_rate_exact(unit)))
+            set_notation(scientific_notation(display_value))
+            set_talking(generate(display_value))
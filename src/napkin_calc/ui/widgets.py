@@ -5,30 +5,61 @@ The main building block is ``ReactiveNumberField`` – a QLineEdit that:
 - Emits a ``value_changed`` signal only on *user* edits.
 - Provides ``set_display_value`` for programmatic updates that do NOT
   trigger the signal (preventing infinite update loops).
+
+``label_font`` hands out shared bold/italic label fonts so panels don't
+build a fresh QFont for every styled label.
 """
 
+import re
 from decimal import Decimal, InvalidOperation
+from functools import cache
 
 from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QValidator
-from PySide6.QtWidgets import QLineEdit, QToolButton
+from PySide6.QtGui import QFont, QValidator
+from PySide6.QtWidgets import QApplication, QLineEdit, QToolButton
+
+
+@cache
+def label_font(*, bold: bool = False, italic: bool = False) -> QFont:
+    """Return the default QLabel font with the given style, built once.
+
+    Must be called after the QApplication exists.  ``setFont`` copies the
+    font, so the shared instance can be passed to any number of labels.
+    """
+    font = QApplication.font("QLabel")
+    font.setBold(bold)
+    font.setItalic(italic)
+    return font
+
+
+# A complete finite number: "12", "-1.5", ".5", "3.", "1e6", "2.5E-3"
+_ACCEPTABLE_RE = re.compile(r"[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?")
+# A prefix that can still become one: "", "-", ".", "1e", "1.5E-"
+_INTERMEDIATE_RE = re.compile(r"[+-]?\d*\.?\d*|[+-]?(?:\d+\.?\d*|\.\d+)[eE][+-]?")
+
+_ACCEPTABLE = QValidator.State.Acceptable
+_INTERMEDIATE = QValidator.State.Intermediate
+_INVALID = QValidator.State.Invalid
 
 
 class DecimalValidator(QValidator):
-    """Accept integers, decimals, and simple scientific notation (e.g. 1e6)."""
+    """Accept integers, decimals, and simple scientific notation (e.g. 1e6).
+
+    Runs on every keystroke, so it matches precompiled patterns instead
+    of test-parsing with ``Decimal``.  Unlike ``Decimal`` the patterns
+    also reject NaN / Infinity, which the engine cannot calculate with.
+    """
 
     def validate(self, text: str, pos: int) -> tuple:  # type: ignore[override]
+        if not text:
+            return (_INTERMEDIATE, text, pos)
         stripped = text.strip().replace(",", "")
-        if stripped == "" or stripped == "-":
-            return (QValidator.State.Intermediate, text, pos)
-        try:
-            Decimal(stripped)
-            return (QValidator.State.Acceptable, text, pos)
-        except InvalidOperation:
-            # Allow partial input like "1e" or "1." while typing
-            if stripped.endswith(("e", "E", ".", "e+", "e-", "E+", "E-")):
-                return (QValidator.State.Intermediate, text, pos)
-            return (QValidator.State.Invalid, text, pos)
+        if _ACCEPTABLE_RE.fullmatch(stripped):
+            return (_ACCEPTABLE, text, pos)
+        # Allow partial input like "1e" or "1." while typing
+        if _INTERMEDIATE_RE.fullmatch(stripped):
+            return (_INTERMEDIATE, text, pos)
+        return (_INVALID, text, pos)
 
 
 class ReactiveNumberField(QLineEdit):
@@ -53,6 +84,9 @@ class ReactiveNumberField(QLineEdit):
     def __init__(self, parent=None, placeholder: str = "0") -> None:
         super().__init__(parent)
         self._updating_programmatically = False
+        # Text last parsed by ``current_value`` and its result
+        self._parsed_text: str | None = None
+        self._parsed_value: Decimal | None = None
 
         self.setValidator(DecimalValidator(self))
         self.setPlaceholderText(placeholder)
@@ -66,22 +100,38 @@ class ReactiveNumberField(QLineEdit):
 
     def set_display_value(self, text: str) -> None:
         """Replace the displayed text *without* emitting ``value_changed``."""
+        # QLineEdit.setText re-lays out the text and moves the cursor even
+        # when the text is identical, so skip the no-op refreshes.
+        if text == self.text():
+            return
         self._updating_programmatically = True
         self.setText(text)
         self._updating_programmatically = False
 
+    def current_value(self) -> Decimal | None:
+        """Return the displayed number, or ``None`` if empty / not numeric.
+
+        The parse is cached against the raw text, so repeated reads (e.g.
+        from unit-dropdown handlers) don't re-strip and re-parse it.
+        """
+        text = self.text()
+        if text != self._parsed_text:
+            cleaned = text.strip().replace(",", "")
+            try:
+                self._parsed_value = Decimal(cleaned) if cleaned else None
+            except InvalidOperation:
+                self._parsed_value = None
+            self._parsed_text = text
+        return self._parsed_value
+
     # -- internal ----------------------------------------------------------
 
     def _on_editing_finished(self) -> None:
         """Handle Return / focus-out from user editing."""
         if self._updating_programmatically:
             return
-        text = self.text().strip().replace(",", "")
-        if not text:
-            return
-        try:
-            value = Decimal(text)
-        except InvalidOperation:
+        value = self.current_value()
+        if value is None:
             return
         self.value_changed.emit(value)
 
@@ -89,6 +139,12 @@ class ReactiveNumberField(QLineEdit):
 _LOCKED_TEXT = "\U0001f512"   # closed padlock
 _UNLOCKED_TEXT = "\U0001f513"  # open padlock
 
+# isChecked() -> (glyph, tooltip)
+_LOCK_STATE = {
+    True: (_LOCKED_TEXT, "This value is held constant"),
+    False: (_UNLOCKED_TEXT, "Click to hold this value constant"),
+}
+
 
 class LockButton(QToolButton):
     """Toggle button that shows a padlock glyph.
@@ -101,14 +157,10 @@ class LockButton(QToolButton):
     def __init__(self, parent=None) -> None:
         super().__init__(parent)
         self.setCheckable(True)
-        self.setToolTip("Click to hold this value constant")
         self._refresh_text()
         self.toggled.connect(self._refresh_text)
 
     def _refresh_text(self, *_args) -> None:
-        if self.isChecked():
-            self.setText(_LOCKED_TEXT)
-            self.setToolTip("This value is held constant")
-        else:
-            self.setText(_UNLOCKED_TEXT)
-            self.setToolTip("Click to hold this value constant")
+        text, tooltip = _LOCK_STATE[self.isChecked()]
+        self.setText(text)
+        self.setToolTip(tooltip)
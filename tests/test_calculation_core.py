@@ -0,0 +1,39 @@
+"""Tests for CalculationCore – the Qt-free calculation model."""
+
+from decimal import Decimal
+
+from napkin_calc.core.calculation_core import CalculationCore
+from napkin_calc.core.constants import DataSizeUnit, LockedVariable, TimeUnit
+
+
+class _RecordingCore(CalculationCore):
+    """Core that records the change notifications it would emit."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.emitted: list[str] = []
+
+    def _emit(self, signal_name: str) -> None:
+        self.emitted.append(signal_name)
+
+
+class TestCalculationCore:
+    def test_computes_without_qt(self) -> None:
+        core = CalculationCore()
+        core.set_rate(Decimal("100"), TimeUnit.SECOND)
+        core.set_payload_size(Decimal("1"), DataSizeUnit.KILOBYTE)
+        assert core.data_throughput_bytes_per_second == Decimal("102400")
+        assert core.locked_variable == LockedVariable.RATE
+
+    def test_emit_hook_receives_signal_names(self) -> None:
+        core = _RecordingCore()
+        core.set_rate(Decimal("10"), TimeUnit.SECOND)
+        assert core.emitted == ["lock_changed", "rates_changed", "storage_changed"]
+
+    def test_nested_batches_emit_once_at_outermost_exit(self) -> None:
+        core = _RecordingCore()
+        with core._batched():
+            core.set_rate(Decimal("10"), TimeUnit.SECOND)
+            core.set_payload_size(Decimal("1"), DataSizeUnit.BYTE)
+            assert core.emitted == []
+        assert core.emitted == ["lock_changed", "rates_changed", "storage_changed"]
@@ -0,0 +1,13 @@
+"""Tests for the unit enums in napkin_calc.core.constants."""
+
+import pytest
+
+from napkin_calc.core.constants import BandwidthUnit, DataSizeUnit, TimeUnit
+
+
+class TestIndexedEnums:
+    """Factor tables are indexed by ``_index``, so it must be 0..n-1."""
+
+    @pytest.mark.parametrize("unit_type", [TimeUnit, DataSizeUnit, BandwidthUnit])
+    def test_indexes_are_contiguous(self, unit_type) -> None:
+        assert [m._index for m in unit_type] == list(range(len(unit_type)))
@@ -67,6 +67,24 @@ class TestGetAllSizes:
         sizes = converter.get_all_sizes(CalculationMode.EXACT)
         assert set(sizes.keys()) == set(DataSizeUnit)
 
+    def test_repeated_calls_return_equal_results(self) -> None:
+        converter = DataSizeConverter()
+        converter.set_size(Decimal("1"), DataSizeUnit.GIGABYTE)
+        first = converter.get_all_sizes(CalculationMode.ESTIMATE)
+        second = converter.get_all_sizes(CalculationMode.ESTIMATE)
+        assert first == second
+        # Callers get their own copy; mutating it must not poison the cache
+        first[DataSizeUnit.BYTE] = Decimal("0")
+        assert converter.get_all_sizes(CalculationMode.ESTIMATE) == second
+
+    def test_cache_invalidated_by_set_size(self) -> None:
+        converter = DataSizeConverter()
+        converter.set_size(Decimal("1"), DataSizeUnit.KILOBYTE)
+        converter.get_all_sizes(CalculationMode.EXACT)
+        converter.set_size(Decimal("2"), DataSizeUnit.KILOBYTE)
+        sizes = converter.get_all_sizes(CalculationMode.EXACT)
+        assert sizes[DataSizeUnit.BYTE] == Decimal("2048")
+
 
 class TestReset:
     def test_reset_zeroes_size(self) -> None:
@@ -21,3 +21,10 @@ class TestDBPCalculator:
         calc.set_bandwidth(Decimal("1"), BandwidthUnit.GBPS, CalculationMode.ESTIMATE)
         calc.set_rtt(Decimal("0"))
         assert calc.data_in_flight_bytes == Decimal("0")
+
+    def test_exact_mode_bandwidth_is_base_10(self) -> None:
+        calc = DBPCalculator()
+        calc.set_bandwidth(Decimal("1"), BandwidthUnit.GBPS, CalculationMode.EXACT)
+        calc.set_rtt(Decimal("1000"))  # 1 s
+        # 1 Gbps is 10^9 bits/sec regardless of display mode
+        assert calc.data_in_flight_bytes == Decimal("125000000")
@@ -6,23 +6,19 @@ These tests require a QApplication instance because the engine is a QObject.
 from decimal import Decimal
 
 import pytest
+from PySide6.QtCore import QObject
+from PySide6.QtTest import QSignalSpy
 
+from napkin_calc.core.calculation_core import CalculationCore
 from napkin_calc.core.constants import CalculationMode, DataSizeUnit, LockedVariable, TimeUnit
 from napkin_calc.core.engine import CalculationEngine
 
+# Tolerance for comparisons against rounded expected values
+_TOL = Decimal("0.001")
 
-@pytest.fixture(scope="module")
-def qapp():
-    """Provide a QApplication for the entire test module.
-
-    PySide6 requires exactly one QApplication per process.
-    """
-    from PySide6.QtWidgets import QApplication
-
-    app = QApplication.instance()
-    if app is None:
-        app = QApplication([])
-    return app
+# 100 events/s × 500 B × 86,400 s = 4,320,000,000 B/day.  Dividing by
+# 2^30 terminates, so exact mode yields this value with no rounding.
+_GB_PER_DAY = Decimal("4320000000") / Decimal("1073741824")
 
 
 @pytest.fixture()
@@ -31,6 +27,28 @@ def engine(qapp) -> CalculationEngine:
     return CalculationEngine()
 
 
+class TestConstruction:
+    def test_core_initialised_once(
+        self, qapp, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        calls = []
+        original_init = CalculationCore.__init__
+
+        def counting_init(self) -> None:
+            calls.append(self)
+            original_init(self)
+
+        monkeypatch.setattr(CalculationCore, "__init__", counting_init)
+        engine = CalculationEngine()
+        assert calls == [engine]
+
+    def test_parent_is_set(self, qapp) -> None:
+        parent = QObject()
+        engine = CalculationEngine(parent)
+        assert engine.parent() is parent
+        assert engine.events_per_second_exact == Decimal("0")
+
+
 class TestDisplayMode:
     def test_default_mode_is_exact(self, engine: CalculationEngine) -> None:
         assert engine.display_mode == CalculationMode.EXACT
@@ -45,10 +63,9 @@ class TestDisplayMode:
         assert engine.display_mode == CalculationMode.EXACT
 
     def test_mode_changed_signal_fires(self, engine: CalculationEngine) -> None:
-        signal_received = []
-        engine.mode_changed.connect(lambda: signal_received.append(True))
+        spy = QSignalSpy(engine.mode_changed)
         engine.toggle_display_mode()
-        assert len(signal_received) == 1
+        assert spy.count() == 1
 
 
 class TestRateOperations:
@@ -59,21 +76,19 @@ class TestRateOperations:
         # so 86400/86400 * 1 = 1
         # Actually get_rate uses display_mode which defaults to ESTIMATE
         # For SECOND, exact and estimate are the same
-        assert abs(result - Decimal("1")) < Decimal("0.001")
+        assert result == pytest.approx(Decimal("1"), abs=_TOL)
 
     def test_rates_changed_signal_fires(self, engine: CalculationEngine) -> None:
-        signal_received = []
-        engine.rates_changed.connect(lambda: signal_received.append(True))
+        spy = QSignalSpy(engine.rates_changed)
         engine.set_rate(Decimal("100"), TimeUnit.SECOND)
-        assert len(signal_received) == 1
+        assert spy.count() == 1
 
     def test_reset_zeros_and_signals(self, engine: CalculationEngine) -> None:
         engine.set_rate(Decimal("1000"), TimeUnit.SECOND)
-        signal_received = []
-        engine.rates_changed.connect(lambda: signal_received.append(True))
+        spy = QSignalSpy(engine.rates_changed)
         engine.reset()
         assert engine.events_per_second_exact == Decimal("0")
-        assert len(signal_received) == 1
+        assert spy.count() == 1
 
     def test_get_rate_exact_always_uses_exact_factors(
         self, engine: CalculationEngine
@@ -85,10 +100,58 @@ class TestRateOperations:
     def test_set_rate_also_fires_storage_changed(
         self, engine: CalculationEngine
     ) -> None:
-        signal_received = []
-        engine.storage_changed.connect(lambda: signal_received.append(True))
+        spy = QSignalSpy(engine.storage_changed)
         engine.set_rate(Decimal("100"), TimeUnit.SECOND)
-        assert len(signal_received) == 1
+        assert spy.count() == 1
+
+
+class TestSignalBatching:
+    """Each mutation emits every affected signal once, after the update."""
+
+    def test_solving_rate_emits_each_signal_once(
+        self, engine: CalculationEngine
+    ) -> None:
+        engine.set_locked_variable(LockedVariable.VOLUME)
+        engine.set_target_throughput(Decimal("50"), DataSizeUnit.KILOBYTE, TimeUnit.SECOND)
+        received = []
+        engine.rates_changed.connect(lambda: received.append("rates"))
+        engine.storage_changed.connect(lambda: received.append("storage"))
+        engine.set_payload_size(Decimal("500"), DataSizeUnit.BYTE)
+        assert received == ["rates", "storage"]
+
+    def test_lock_changed_sees_final_state(
+        self, engine: CalculationEngine
+    ) -> None:
+        """Auto-lock is announced only after the rate has been solved."""
+        engine.set_target_throughput(Decimal("50"), DataSizeUnit.KILOBYTE, TimeUnit.SECOND)
+        engine.set_locked_variable(LockedVariable.NONE)
+        seen = []
+        engine.lock_changed.connect(
+            lambda: seen.append(engine.events_per_second_exact)
+        )
+        engine.set_payload_size(Decimal("500"), DataSizeUnit.BYTE)
+        assert seen == [Decimal("102.4")]
+
+    def test_unchanged_payload_emits_nothing(
+        self, engine: CalculationEngine
+    ) -> None:
+        engine.set_payload_size(Decimal("500"), DataSizeUnit.BYTE)
+        received = []
+        engine.storage_changed.connect(lambda: received.append("storage"))
+        engine.set_payload_size(Decimal("500"), DataSizeUnit.BYTE)
+        engine.set_rate(Decimal("0"), TimeUnit.SECOND)
+        assert received == []
+
+    def test_reset_of_clean_engine_only_announces_reset(
+        self, engine: CalculationEngine
+    ) -> None:
+        received = []
+        engine.rates_changed.connect(lambda: received.append("rates"))
+        engine.storage_changed.connect(lambda: received.append("storage"))
+        engine.lock_changed.connect(lambda: received.append("lock"))
+        engine.reset_occurred.connect(lambda: received.append("reset"))
+        engine.reset()
+        assert received == ["reset"]
 
 
 class TestPayloadAndStorage:
@@ -101,10 +164,9 @@ class TestPayloadAndStorage:
     def test_storage_changed_signal_on_payload(
         self, engine: CalculationEngine
     ) -> None:
-        signal_received = []
-        engine.storage_changed.connect(lambda: signal_received.append(True))
+        spy = QSignalSpy(engine.storage_changed)
         engine.set_payload_size(Decimal("500"), DataSizeUnit.BYTE)
-        assert len(signal_received) == 1
+        assert spy.count() == 1
 
     def test_data_throughput_bytes_per_second(
         self, engine: CalculationEngine
@@ -114,6 +176,15 @@ class TestPayloadAndStorage:
         # 100 events/sec * 500 bytes = 50,000 bytes/sec
         assert engine.data_throughput_bytes_per_second == Decimal("50000")
 
+    def test_data_throughput_follows_later_edits(
+        self, engine: CalculationEngine
+    ) -> None:
+        engine.set_rate(Decimal("100"), TimeUnit.SECOND)
+        engine.set_payload_size(Decimal("500"), DataSizeUnit.BYTE)
+        assert engine.data_throughput_bytes_per_second == Decimal("50000")
+        engine.set_payload_size(Decimal("1"), DataSizeUnit.KILOBYTE)
+        assert engine.data_throughput_bytes_per_second == Decimal("102400")
+
     def test_data_throughput_per_day(self, engine: CalculationEngine) -> None:
         engine.set_rate(Decimal("100"), TimeUnit.SECOND)
         engine.set_payload_size(Decimal("500"), DataSizeUnit.BYTE)
@@ -126,7 +197,14 @@ class TestPayloadAndStorage:
         engine.set_payload_size(Decimal("500"), DataSizeUnit.BYTE)
         gb_per_day = engine.get_data_throughput(TimeUnit.DAY, DataSizeUnit.GIGABYTE)
         # 4,320,000,000 / 1,073,741,824 ≈ 4.02 GB (exact mode)
-        assert abs(gb_per_day - Decimal("4.02")) < Decimal("0.01")
+        assert gb_per_day == _GB_PER_DAY
+
+    def test_data_throughput_divides_last(self, engine: CalculationEngine) -> None:
+        # 1234.5 B/s in EB/day rounds differently if 86400 / 2^60 is taken first
+        engine.set_rate(Decimal("1234.5"), TimeUnit.SECOND)
+        engine.set_payload_size(Decimal("1"), DataSizeUnit.BYTE)
+        eb_per_day = engine.get_data_throughput(TimeUnit.DAY, DataSizeUnit.EXABYTE)
+        assert eb_per_day == Decimal("1234.5") * Decimal("86400") / Decimal(2**60)
 
     def test_best_unit_selection(self, engine: CalculationEngine) -> None:
         engine.set_rate(Decimal("100"), TimeUnit.SECOND)
@@ -134,7 +212,18 @@ class TestPayloadAndStorage:
         value, unit = engine.get_data_throughput_best_unit(TimeUnit.DAY)
         # ~4.02 GB/day (exact) → best unit should be GB
         assert unit == DataSizeUnit.GIGABYTE
-        assert abs(value - Decimal("4.02")) < Decimal("0.01")
+        assert value == _GB_PER_DAY
+
+    def test_all_throughputs_match_per_unit_getters(
+        self, engine: CalculationEngine
+    ) -> None:
+        engine.set_rate(Decimal("100"), TimeUnit.SECOND)
+        engine.set_payload_size(Decimal("500"), DataSizeUnit.BYTE)
+        rows = engine.get_all_throughputs()
+        assert set(rows) == set(TimeUnit)
+        for time_unit, (total_bytes, value, unit) in rows.items():
+            assert total_bytes == engine.get_data_throughput_bytes(time_unit)
+            assert (value, unit) == engine.get_data_throughput_best_unit(time_unit)
 
     def test_reset_clears_payload(self, engine: CalculationEngine) -> None:
         engine.set_payload_size(Decimal("1"), DataSizeUnit.MEGABYTE)
@@ -0,0 +1,24 @@
+"""Tests that the Qt-free layers stay importable without PySide6."""
+
+import subprocess
+import sys
+
+import pytest
+
+
+class TestQtFreeImports:
+    @pytest.mark.parametrize(
+        "module",
+        [
+            "napkin_calc.core.calculation_core",
+            "napkin_calc.formatting.display_formatter",
+            "napkin_calc.formatting.talking_points",
+        ],
+    )
+    def test_import_does_not_load_qt(self, module: str) -> None:
+        code = (
+            "import sys\n"
+            f"import {module}\n"
+            "assert 'PySide6' not in sys.modules\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
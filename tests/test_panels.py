@@ -0,0 +1,134 @@
+"""Tests for the input panels' reaction to engine changes.
+
+These need a QApplication (see ``qapp`` in conftest.py) and run under any
+Qt platform plugin, including ``offscreen``.
+"""
+
+from decimal import Decimal
+
+import pytest
+from PySide6.QtCore import QCoreApplication
+
+from napkin_calc.core.constants import DataSizeUnit, TimeUnit
+from napkin_calc.core.engine import CalculationEngine
+from napkin_calc.ui.data_volume_panel import DataVolumePanel
+from napkin_calc.ui.dbp_panel import DBPPanel
+from napkin_calc.ui.main_window import MainWindow
+from napkin_calc.ui.reference_panel import ReferencePanel
+from napkin_calc.ui.traffic_panel import TrafficPanel
+
+
+def _flush_events() -> None:
+    """Run the refreshes the panels scheduled on the event loop."""
+    QCoreApplication.processEvents()
+
+
+def _type(field, text: str) -> None:
+    """Simulate the user typing *text* into *field* and pressing Return."""
+    field.setText(text)
+    field.editingFinished.emit()
+    _flush_events()
+
+
+@pytest.fixture()
+def engine(qapp) -> CalculationEngine:
+    return CalculationEngine()
+
+
+@pytest.fixture()
+def traffic_panel(engine: CalculationEngine) -> TrafficPanel:
+    panel = TrafficPanel(engine)
+    panel.show()
+    _flush_events()
+    yield panel
+    panel.close()
+
+
+@pytest.fixture()
+def volume_panel(engine: CalculationEngine) -> DataVolumePanel:
+    panel = DataVolumePanel(engine)
+    panel.show()
+    _flush_events()
+    yield panel
+    panel.close()
+
+
+class TestResetOnCleanEngine:
+    """Reset clears typed-in text even when the engine is already zero."""
+
+    def test_traffic_fields_cleared(
+        self, engine: CalculationEngine, traffic_panel: TrafficPanel
+    ) -> None:
+        field = traffic_panel._fields[TimeUnit.SECOND]
+        field.setText("0.000")  # typed, but not committed with Return
+
+        engine.reset()
+        _flush_events()
+
+        assert field.text() == "0"
+
+    def test_payload_field_and_unit_cleared(
+        self, engine: CalculationEngine, volume_panel: DataVolumePanel
+    ) -> None:
+        _type(volume_panel._payload_field, "0")
+        volume_panel._payload_unit_combo.setCurrentIndex(
+            volume_panel._payload_unit_combo.findData(DataSizeUnit.MEGABYTE)
+        )
+
+        engine.reset()
+        _flush_events()
+
+        assert volume_panel._payload_field.text() == ""
+        assert volume_panel._payload_unit_combo.currentData() is DataSizeUnit.KILOBYTE
+
+
+class TestTrafficFieldNormalised:
+    """A committed edit is redrawn in the panel's canonical format."""
+
+    def test_equal_rate_with_target_pending(
+        self, engine: CalculationEngine, traffic_panel: TrafficPanel
+    ) -> None:
+        engine.set_target_throughput(Decimal("1"), DataSizeUnit.TERABYTE, TimeUnit.DAY)
+        engine.set_rate(Decimal("1"), TimeUnit.SECOND)
+        _flush_events()
+
+        field = traffic_panel._fields[TimeUnit.MINUTE]
+        _type(field, "60.000")
+
+        assert field.text() == "60"
+
+    def test_noop_edit(
+        self, engine: CalculationEngine, traffic_panel: TrafficPanel
+    ) -> None:
+        engine.set_rate(Decimal("1"), TimeUnit.SECOND)
+        _flush_events()
+
+        field = traffic_panel._fields[TimeUnit.MINUTE]
+        _type(field, "60.000")
+
+        assert field.text() == "60"
+
+
+class TestPayloadFieldNormalised:
+    """A committed payload edit is redrawn even when it changes nothing."""
+
+    def test_zero_into_empty_field(
+        self, engine: CalculationEngine, volume_panel: DataVolumePanel
+    ) -> None:
+        _type(volume_panel._payload_field, "0")
+
+        assert volume_panel._payload_field.text() == ""
+
+
+class TestMainWindowPanels:
+    """Every panel exists as soon as the window is built, shown or not."""
+
+    @pytest.mark.parametrize(
+        "panel_type", [TrafficPanel, DataVolumePanel, DBPPanel, ReferencePanel]
+    )
+    def test_built_before_show(self, qapp, panel_type) -> None:
+        window = MainWindow()
+        try:
+            assert window.findChild(panel_type) is not None
+        finally:
+            window.deleteLater()
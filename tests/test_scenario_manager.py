@@ -10,15 +10,7 @@ from napkin_calc.core.constants import CalculationMode, DataSizeUnit, TimeUnit
 from napkin_calc.core.engine import CalculationEngine
 from napkin_calc.persistence.scenario_manager import ScenarioManager
 
-
-@pytest.fixture(scope="module")
-def qapp():
-    from PySide6.QtWidgets import QApplication
-
-    app = QApplication.instance()
-    if app is None:
-        app = QApplication([])
-    return app
+_TOL = Decimal("0.0001")
 
 
 @pytest.fixture()
@@ -31,46 +23,48 @@ def manager(engine) -> ScenarioManager:
     return ScenarioManager(engine)
 
 
+@pytest.fixture(scope="class")
+def saved_data(qapp, tmp_path_factory: pytest.TempPathFactory) -> dict:
+    """Parsed contents of one saved file, shared by a test class."""
+    engine = CalculationEngine()
+    engine.set_rate(Decimal("1000"), TimeUnit.SECOND)
+    file = tmp_path_factory.mktemp("format") / "named.npkn"
+    ScenarioManager(engine).save(file, scenario_name="Video Streaming")
+    return json.loads(file.read_bytes())
+
+
 class TestSaveLoad:
-    """Save state to a file, load it back, verify everything matches."""
+    """Save state, load it back, verify everything matches."""
 
-    def test_round_trip_preserves_rate(
-        self, engine: CalculationEngine, manager: ScenarioManager, tmp_path: Path
-    ) -> None:
+    def test_round_trip_preserves_rate(self, engine: CalculationEngine) -> None:
         engine.set_rate(Decimal("10000000"), TimeUnit.DAY)
-        file = tmp_path / "test.npkn"
-        manager.save(file)
+        data = ScenarioManager.to_dict(engine)
 
-        # Create a fresh engine and load into it
+        # Restore into a fresh engine
         fresh_engine = CalculationEngine()
-        fresh_manager = ScenarioManager(fresh_engine)
-        fresh_manager.load(file)
+        ScenarioManager.from_dict(fresh_engine, data)
 
-        assert abs(
-            fresh_engine.events_per_second_exact - engine.events_per_second_exact
-        ) < Decimal("0.0001")
+        assert fresh_engine.events_per_second_exact == pytest.approx(
+            engine.events_per_second_exact, abs=_TOL
+        )
 
-    def test_round_trip_preserves_payload(
-        self, engine: CalculationEngine, manager: ScenarioManager, tmp_path: Path
-    ) -> None:
+    def test_round_trip_preserves_payload(self, engine: CalculationEngine) -> None:
         engine.set_payload_size(Decimal("400"), DataSizeUnit.BYTE)
-        file = tmp_path / "test.npkn"
-        manager.save(file)
+        data = ScenarioManager.to_dict(engine)
 
         fresh_engine = CalculationEngine()
-        ScenarioManager(fresh_engine).load(file)
+        ScenarioManager.from_dict(fresh_engine, data)
 
         assert fresh_engine.payload_size_bytes == Decimal("400")
 
     def test_round_trip_preserves_display_mode(
-        self, engine: CalculationEngine, manager: ScenarioManager, tmp_path: Path
+        self, engine: CalculationEngine
     ) -> None:
         engine.set_display_mode(CalculationMode.EXACT)
-        file = tmp_path / "test.npkn"
-        manager.save(file)
+        data = ScenarioManager.to_dict(engine)
 
         fresh_engine = CalculationEngine()
-        ScenarioManager(fresh_engine).load(file)
+        ScenarioManager.from_dict(fresh_engine, data)
 
         assert fresh_engine.display_mode == CalculationMode.EXACT
 
@@ -92,35 +86,91 @@ class TestSaveLoad:
         assert name == "Chat App"
         assert fresh_engine.display_mode == CalculationMode.EXACT
         assert fresh_engine.payload_size_bytes == Decimal("2048")
-        assert abs(
-            fresh_engine.events_per_second_exact - engine.events_per_second_exact
-        ) < Decimal("0.0001")
+        assert fresh_engine.events_per_second_exact == pytest.approx(
+            engine.events_per_second_exact, abs=_TOL
+        )
+
+    def test_load_announces_each_change_once_with_final_state(
+        self, engine: CalculationEngine, manager: ScenarioManager, tmp_path: Path
+    ) -> None:
+        engine.set_rate(Decimal("10"), TimeUnit.SECOND)
+        engine.set_payload_size(Decimal("400"), DataSizeUnit.BYTE)
+        file = tmp_path / "test.npkn"
+        manager.save(file)
+
+        fresh_engine = CalculationEngine()
+        seen = []
+        fresh_engine.storage_changed.connect(
+            lambda: seen.append(
+                (fresh_engine.events_per_second_exact, fresh_engine.payload_size_bytes)
+            )
+        )
+        ScenarioManager(fresh_engine).load(file)
+
+        assert seen == [(Decimal("10"), Decimal("400"))]
+
+    def test_missing_display_mode_defaults_to_estimate(
+        self, engine: CalculationEngine, manager: ScenarioManager, tmp_path: Path
+    ) -> None:
+        engine.set_display_mode(CalculationMode.EXACT)
+        file = tmp_path / "old.npkn"
+        file.write_text(
+            json.dumps({"events_per_second": "10", "payload_size_bytes": "400"})
+        )
+
+        manager.load(file)
+        assert engine.display_mode == CalculationMode.ESTIMATE
+
+    @pytest.mark.parametrize(
+        "display_mode", ["approximate", ["exact"]], ids=["unknown", "non_string"]
+    )
+    def test_invalid_display_mode_rejected(
+        self, manager: ScenarioManager, tmp_path: Path, display_mode: object
+    ) -> None:
+        file = tmp_path / "bad.npkn"
+        file.write_text(
+            json.dumps(
+                {
+                    "events_per_second": "10",
+                    "payload_size_bytes": "400",
+                    "display_mode": display_mode,
+                }
+            )
+        )
+
+        with pytest.raises(ValueError, match="is not a valid CalculationMode"):
+            manager.load(file)
 
 
 class TestFileFormat:
     """Verify the JSON file structure."""
 
-    def test_saved_file_is_valid_json(
+    def test_saved_file_is_valid_json(self, saved_data: dict) -> None:
+        assert "napkin_calc_version" in saved_data
+        assert "events_per_second" in saved_data
+        assert "payload_size_bytes" in saved_data
+        assert "display_mode" in saved_data
+
+    def test_scenario_name_stored(self, saved_data: dict) -> None:
+        assert saved_data["scenario_name"] == "Video Streaming"
+
+    def test_non_ascii_scenario_name_written_verbatim(
         self, engine: CalculationEngine, manager: ScenarioManager, tmp_path: Path
     ) -> None:
-        engine.set_rate(Decimal("1000"), TimeUnit.SECOND)
-        file = tmp_path / "test.npkn"
-        manager.save(file)
+        file = tmp_path / "named.npkn"
+        manager.save(file, scenario_name="Czat – Łódź")
 
-        data = json.loads(file.read_text())
-        assert "napkin_calc_version" in data
-        assert "events_per_second" in data
-        assert "payload_size_bytes" in data
-        assert "display_mode" in data
+        assert "Czat – Łódź" in file.read_text(encoding="utf-8")
+        assert manager.load(file) == "Czat – Łódź"
 
-    def test_scenario_name_stored(
+    def test_encode_matches_saved_file(
         self, engine: CalculationEngine, manager: ScenarioManager, tmp_path: Path
     ) -> None:
-        file = tmp_path / "named.npkn"
-        manager.save(file, scenario_name="Video Streaming")
+        engine.set_rate(Decimal("1000"), TimeUnit.SECOND)
+        file = tmp_path / "test.npkn"
+        manager.save(file, scenario_name="Chat App")
 
-        data = json.loads(file.read_text())
-        assert data["scenario_name"] == "Video Streaming"
+        assert manager.encode("Chat App") == file.read_bytes()
 
 
 class TestToDict:
@@ -2,6 +2,8 @@
 
 from decimal import Decimal
 
+import pytest
+
 from napkin_calc.core.constants import DataSizeUnit
 from napkin_calc.formatting.talking_points import TalkingPointGenerator
 
@@ -9,57 +11,55 @@ from napkin_calc.formatting.talking_points import TalkingPointGenerator
 class TestTalkingPointGenerator:
     """Generate speakable phrases at various magnitudes."""
 
-    def test_zero(self) -> None:
-        assert TalkingPointGenerator.generate(Decimal("0")) == "0"
-
-    def test_small_value(self) -> None:
-        result = TalkingPointGenerator.generate(Decimal("42"))
-        assert result == "~42"
-
-    def test_small_fractional(self) -> None:
-        result = TalkingPointGenerator.generate(Decimal("3.7"))
-        assert result == "~3.7"
-
-    def test_thousands(self) -> None:
-        result = TalkingPointGenerator.generate(Decimal("6944"))
-        assert "thousand" in result
-        assert "6.9" in result
-
-    def test_exact_thousand(self) -> None:
-        result = TalkingPointGenerator.generate(Decimal("1000"))
-        assert result == "1 thousand"
-
-    def test_millions(self) -> None:
-        result = TalkingPointGenerator.generate(Decimal("10000000"))
-        assert result == "10 million"
-
-    def test_millions_approximate(self) -> None:
-        result = TalkingPointGenerator.generate(Decimal("4500000"))
-        assert "million" in result
-        assert "4.5" in result
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            ("0", "0"),
+            ("42", "~42"),
+            ("3.7", "~3.7"),
+            ("1000", "1 thousand"),
+            ("10000000", "10 million"),
+            ("1000000000", "1 billion"),
+            ("0.12", "~0.1"),
+            ("116", "~116"),
+            ("5E20", "500 quintillion"),
+        ],
+        ids=[
+            "zero",
+            "small_value",
+            "small_fractional",
+            "exact_thousand",
+            "millions",
+            "exact_billion",
+            "sub_ten_keeps_decimal",
+            "hundred_rounds_to_whole",
+            "beyond_largest_tier_stays_quintillion",
+        ],
+    )
+    def test_exact_phrase(self, value: str, expected: str) -> None:
+        assert TalkingPointGenerator.generate(Decimal(value)) == expected
+
+    @pytest.mark.parametrize(
+        ("value", "expected_parts"),
+        [
+            ("6944", ("thousand", "6.9")),
+            ("4500000", ("million", "4.5")),
+            ("2500000000000", ("trillion", "2.5")),
+        ],
+        ids=["thousands", "millions_approximate", "trillions"],
+    )
+    def test_approximate_phrase(
+        self, value: str, expected_parts: tuple[str, ...]
+    ) -> None:
+        result = TalkingPointGenerator.generate(Decimal(value))
+        for part in expected_parts:
+            assert part in result
 
     def test_billions(self) -> None:
         result = TalkingPointGenerator.generate(Decimal("3650000000"))
         assert "billion" in result
         assert "3.7" in result or "3.6" in result
 
-    def test_exact_billion(self) -> None:
-        result = TalkingPointGenerator.generate(Decimal("1000000000"))
-        assert result == "1 billion"
-
-    def test_trillions(self) -> None:
-        result = TalkingPointGenerator.generate(Decimal("2500000000000"))
-        assert "trillion" in result
-        assert "2.5" in result
-
-    def test_sub_ten_keeps_decimal(self) -> None:
-        result = TalkingPointGenerator.generate(Decimal("0.12"))
-        assert result == "~0.1"
-
-    def test_hundred_rounds_to_whole(self) -> None:
-        result = TalkingPointGenerator.generate(Decimal("116"))
-        assert result == "~116"
-
 
 class TestDataSizeTalkingPoints:
     """Data-size specific talking points with unit labels."""
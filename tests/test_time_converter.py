@@ -3,32 +3,72 @@
 from decimal import Decimal
 
 import pytest
-
-from napkin_calc.core.constants import CalculationMode, TimeUnit
-from napkin_calc.core.time_converter import TimeUnitConverter
+from hypothesis import given
+from hypothesis import strategies as st
+
+from napkin_calc.core.constants import CalculationMode, TimeUnit, seconds_per_unit
+from napkin_calc.core.time_converter import (
+    _ALL_UNITS,
+    _ZERO,
+    TimeUnitConverter,
+)
+
+# Tolerances for comparisons against rounded expected values
+_TOL = Decimal("0.001")
+_TOL_CENT = Decimal("0.01")
+# Relative bound for round trips through the 28-digit default context
+_REL_TOL = Decimal("1e-25")
+
+_rates = st.decimals(
+    min_value=Decimal("0.01"),
+    max_value=Decimal("1000000000"),
+    places=2,
+    allow_nan=False,
+    allow_infinity=False,
+)
+_units = st.sampled_from(list(TimeUnit))
+
+
+@pytest.fixture(scope="module")
+def sec_converter() -> TimeUnitConverter:
+    """Converter holding 1 event/second, shared by read-only tests."""
+    converter = TimeUnitConverter()
+    converter.set_rate(Decimal("1"), TimeUnit.SECOND)
+    return converter
 
 
 class TestSetAndGetRate:
     """Setting a rate in one unit and reading it back in others."""
 
-    def test_set_per_day_read_per_second(self) -> None:
-        converter = TimeUnitConverter()
-        # 86,400 events per day  =  1 event per second (exact)
-        converter.set_rate(Decimal("86400"), TimeUnit.DAY)
-        result = converter.get_rate(TimeUnit.SECOND, CalculationMode.EXACT)
-        assert result == Decimal("1")
-
-    def test_set_per_second_read_per_minute(self) -> None:
-        converter = TimeUnitConverter()
-        converter.set_rate(Decimal("100"), TimeUnit.SECOND)
-        result = converter.get_rate(TimeUnit.MINUTE, CalculationMode.EXACT)
-        assert result == Decimal("6000")
-
-    def test_set_per_hour_read_per_day(self) -> None:
+    @pytest.mark.parametrize(
+        ("value", "in_unit", "out_unit", "expected"),
+        [
+            # 86,400 events per day  =  1 event per second (exact)
+            ("86400", TimeUnit.DAY, TimeUnit.SECOND, "1"),
+            ("100", TimeUnit.SECOND, TimeUnit.MINUTE, "6000"),
+            ("1000", TimeUnit.HOUR, TimeUnit.DAY, "24000"),
+        ],
+        ids=[
+            "per_day_read_per_second",
+            "per_second_read_per_minute",
+            "per_hour_read_per_day",
+        ],
+    )
+    def test_set_get_roundtrip(
+        self, value: str, in_unit: TimeUnit, out_unit: TimeUnit, expected: str
+    ) -> None:
         converter = TimeUnitConverter()
-        converter.set_rate(Decimal("1000"), TimeUnit.HOUR)
-        result = converter.get_rate(TimeUnit.DAY, CalculationMode.EXACT)
-        assert result == Decimal("24000")
+        converter.set_rate(Decimal(value), in_unit)
+        result = converter.get_rate(out_unit, CalculationMode.EXACT)
+        assert result == Decimal(expected)
+
+    @pytest.mark.parametrize("mode", list(CalculationMode))
+    @pytest.mark.parametrize("unit", list(TimeUnit))
+    def test_rates_stay_decimal(
+        self, sec_converter: TimeUnitConverter, unit: TimeUnit, mode: CalculationMode
+    ) -> None:
+        # A float fast path would silently lose the exact-mode guarantee
+        assert type(sec_converter.get_rate(unit, mode)) is Decimal
 
     def test_ten_million_per_day_requirements_example(self) -> None:
         """FR2 example: 10 million requests/day -> various units."""
@@ -37,47 +77,130 @@ class TestSetAndGetRate:
 
         per_second = converter.get_rate(TimeUnit.SECOND, CalculationMode.EXACT)
         # 10_000_000 / 86400 ≈ 115.7407…
-        assert abs(per_second - Decimal("115.7407")) < Decimal("0.001")
+        assert per_second == pytest.approx(Decimal("115.7407"), abs=_TOL)
 
         per_hour = converter.get_rate(TimeUnit.HOUR, CalculationMode.EXACT)
         # 10_000_000 / 24 ≈ 416666.67
-        assert abs(per_hour - Decimal("416666.67")) < Decimal("0.01")
+        assert per_hour == pytest.approx(Decimal("416666.67"), abs=_TOL_CENT)
 
 
-class TestExactVsEstimate:
-    """Verify that estimate mode uses rounded conversion factors."""
+class TestRateProperties:
+    """Invariants that hold for any positive rate and pair of units."""
 
-    def test_per_month_exact_vs_estimate(self) -> None:
+    @given(value=_rates, unit=_units)
+    def test_set_then_read_same_unit(self, value: Decimal, unit: TimeUnit) -> None:
         converter = TimeUnitConverter()
-        converter.set_rate(Decimal("1"), TimeUnit.SECOND)
-
-        exact_month = converter.get_rate(TimeUnit.MONTH, CalculationMode.EXACT)
-        estimate_month = converter.get_rate(TimeUnit.MONTH, CalculationMode.ESTIMATE)
-
-        # Exact: 1 month = 2,629,800 seconds (30.4375 days)
-        assert exact_month == Decimal("2629800")
-        # Estimate: 1 month = 2,592,000 seconds (30 days)
-        assert estimate_month == Decimal("2592000")
-
-    def test_per_year_exact_vs_estimate(self) -> None:
+        converter.set_rate(value, unit)
+        result = converter.get_rate(unit, CalculationMode.EXACT)
+        assert abs(result - value) <= value * _REL_TOL
+
+    @given(value=_rates, in_unit=_units, out_unit=_units)
+    def test_cross_unit_scales_by_seconds_ratio(
+        self, value: Decimal, in_unit: TimeUnit, out_unit: TimeUnit
+    ) -> None:
         converter = TimeUnitConverter()
-        converter.set_rate(Decimal("1"), TimeUnit.SECOND)
+        converter.set_rate(value, in_unit)
+        result = converter.get_rate(out_unit, CalculationMode.EXACT)
+        expected = (
+            value
+            * seconds_per_unit(out_unit, CalculationMode.EXACT)
+            / seconds_per_unit(in_unit, CalculationMode.EXACT)
+        )
+        assert abs(result - expected) <= expected * _REL_TOL
 
-        exact_year = converter.get_rate(TimeUnit.YEAR, CalculationMode.EXACT)
-        estimate_year = converter.get_rate(TimeUnit.YEAR, CalculationMode.ESTIMATE)
 
-        assert exact_year == Decimal("31557600")    # 365.25 days
-        assert estimate_year == Decimal("31536000")  # 365 days
+class TestExactVsEstimate:
+    """Verify that estimate mode uses rounded conversion factors."""
+
+    @pytest.mark.parametrize(
+        ("unit", "exact", "estimate"),
+        [
+            # Exact: 1 month = 2,629,800 seconds (30.4375 days)
+            # Estimate: 1 month = 2,592,000 seconds (30 days)
+            (TimeUnit.MONTH, "2629800", "2592000"),
+            # Exact: 365.25 days; estimate: 365 days
+            (TimeUnit.YEAR, "31557600", "31536000"),
+        ],
+        ids=["per_month", "per_year"],
+    )
+    def test_exact_vs_estimate(
+        self,
+        sec_converter: TimeUnitConverter,
+        unit: TimeUnit,
+        exact: str,
+        estimate: str,
+    ) -> None:
+        exact_rate = sec_converter.get_rate(unit, CalculationMode.EXACT)
+        estimate_rate = sec_converter.get_rate(unit, CalculationMode.ESTIMATE)
+
+        assert exact_rate == Decimal(exact)
+        assert estimate_rate == Decimal(estimate)
+
+
+# (unit, exact seconds, estimate seconds)
+_SECONDS_PER_UNIT_CASES = [
+    (TimeUnit.SECOND, "1", "1"),
+    (TimeUnit.MINUTE, "60", "60"),
+    (TimeUnit.HOUR, "3600", "3600"),
+    (TimeUnit.DAY, "86400", "86400"),
+    (TimeUnit.MONTH, "2629800", "2592000"),
+    (TimeUnit.YEAR, "31557600", "31536000"),
+]
+
+
+class TestSecondsPerUnit:
+    """The precomputed factor table covers every unit in both modes."""
+
+    @pytest.mark.parametrize(
+        ("unit", "exact", "estimate"),
+        _SECONDS_PER_UNIT_CASES,
+        ids=[case[0].name for case in _SECONDS_PER_UNIT_CASES],
+    )
+    def test_factor(self, unit: TimeUnit, exact: str, estimate: str) -> None:
+        assert seconds_per_unit(unit, CalculationMode.EXACT) == Decimal(exact)
+        assert seconds_per_unit(unit, CalculationMode.ESTIMATE) == Decimal(estimate)
+
+    def test_cases_cover_every_unit(self) -> None:
+        assert [case[0] for case in _SECONDS_PER_UNIT_CASES] == list(TimeUnit)
+
+    def test_lookups_are_memoized(self, sec_converter: TimeUnitConverter) -> None:
+        seconds_per_unit.cache_clear()
+        sec_converter.get_rate(TimeUnit.YEAR, CalculationMode.EXACT)
+        sec_converter.get_rate(TimeUnit.YEAR, CalculationMode.EXACT)
+        assert seconds_per_unit.cache_info().hits >= 1
 
 
 class TestGetAllRates:
     """get_all_rates should return a dict covering every TimeUnit."""
 
-    def test_returns_all_units(self) -> None:
+    def test_returns_all_units(self, sec_converter: TimeUnitConverter) -> None:
+        rates = sec_converter.get_all_rates(CalculationMode.EXACT)
+        # Same keys as TimeUnit, in declaration order
+        assert list(rates) == list(_ALL_UNITS)
+
+    def test_matches_per_unit_get_rate(self) -> None:
+        converter = TimeUnitConverter()
+        converter.set_rate(Decimal("10000000"), TimeUnit.DAY)
+        for mode in CalculationMode:
+            rates = converter.get_all_rates(mode)
+            for unit in TimeUnit:
+                assert rates[unit] == converter.get_rate(unit, mode)
+
+    def test_cache_invalidated_by_set_rate(self) -> None:
+        converter = TimeUnitConverter()
+        converter.set_rate(Decimal("1"), TimeUnit.SECOND)
+        converter.get_all_rates(CalculationMode.EXACT)
+        converter.set_rate(Decimal("2"), TimeUnit.SECOND)
+        rates = converter.get_all_rates(CalculationMode.EXACT)
+        assert rates[TimeUnit.MINUTE] == Decimal("120")
+
+    def test_cache_invalidated_by_events_per_second(self) -> None:
         converter = TimeUnitConverter()
         converter.set_rate(Decimal("1"), TimeUnit.SECOND)
+        converter.get_all_rates(CalculationMode.EXACT)
+        converter.events_per_second = Decimal("2")
         rates = converter.get_all_rates(CalculationMode.EXACT)
-        assert set(rates.keys()) == set(TimeUnit)
+        assert rates[TimeUnit.MINUTE] == Decimal("120")
 
 
 class TestReset:
@@ -88,3 +211,42 @@ class TestReset:
         converter.set_rate(Decimal("1000"), TimeUnit.SECOND)
         converter.reset()
         assert converter.events_per_second == Decimal("0")
+
+    def test_reset_reuses_shared_zero(self) -> None:
+        converter = TimeUnitConverter()
+        converter.set_rate(Decimal("1000"), TimeUnit.SECOND)
+        converter.reset()
+        assert converter.events_per_second is _ZERO
+
+
+class TestSlots:
+    """The converter is slotted, so instances carry no ``__dict__``."""
+
+    def test_converter_is_slotted(self) -> None:
+        assert "_events_per_second" in TimeUnitConverter.__slots__
+        converter = TimeUnitConverter()
+        assert not hasattr(converter, "__dict__")
+        with pytest.raises(AttributeError):
+            converter.nonexistent = 1
+
+
+class TestGetRateBenchmark:
+    """Timing baselines for get_rate (pytest-benchmark).
+
+    get_rate keeps no cache, so the shared converter gives the same
+    per-call cost as a fresh one.
+    """
+
+    @pytest.mark.benchmark(
+        group="get_rate",
+        warmup=True,
+        warmup_iterations=1000,
+        min_rounds=7,
+        max_time=0.25,
+    )
+    @pytest.mark.parametrize("mode", list(CalculationMode))
+    def test_bench_get_rate(
+        self, benchmark, sec_converter: TimeUnitConverter, mode: CalculationMode
+    ) -> None:
+        result = benchmark(sec_converter.get_rate, TimeUnit.YEAR, mode)
+        assert result > 0